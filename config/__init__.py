@@ -1,7 +1,8 @@
 # Open-EZ PDE Configuration Module
+from typing import Any
+
 from .aircraft_config import (
     AircraftConfig,
-    config,
     AirfoilType,
     FoamType,
     Ply,
@@ -16,3 +17,14 @@ __all__ = [
     "Ply",
     "LaminateDefinition",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The singleton is created on first access (see aircraft_config.__getattr__)
+    if name != "config":
+        raise AttributeError(f"module 'config' has no attribute '{name}'")
+
+    from .aircraft_config import config
+
+    globals()["config"] = config
+    return config
@@ -10,9 +10,18 @@ Safety Mandate: Roncz R1145MS canard airfoil is the DEFAULT.
 The original GU25-5(11)8 caused dangerous pitch-down in rain.
 """
 
-from dataclasses import dataclass, field
+import math
+import sys
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+
+if TYPE_CHECKING:
+    import numpy as np
+    from _typeshed import DataclassInstance
 
 
 class AirfoilType(Enum):
@@ -23,6 +32,10 @@ class AirfoilType(Enum):
     GU25_5_11_8 = "gu25_5_11_8"  # DEPRECATED - unsafe in rain
 
 
+# Airfoil identifiers for report text, resolved once per member.
+_AIRFOIL_STR: dict[AirfoilType, str] = {m: m.value for m in AirfoilType}
+
+
 class FoamType(Enum):
     """Foam core materials with thermal properties for hot-wire cutting."""
 
@@ -39,12 +52,26 @@ class BuildMethod(Enum):
 
 
 class PropulsionType(Enum):
-    """Powerplant options."""
+    """Powerplant options.
+
+    Each member carries its string value, an ``electric`` flag and the
+    battery energy density in Wh/kg (0.0 for IC engines).
+    """
+
+    LYCOMING_O235 = ("lycoming_o235", False, 0.0)  # 115 HP gasoline (baseline)
+    LYCOMING_O320 = ("lycoming_o320", False, 0.0)  # 150 HP gasoline (performance)
+    ELECTRIC_LIFEPO4 = ("electric_lifepo4", True, 150.0)  # LiFePO4 battery electric
+    ELECTRIC_NMC = ("electric_nmc", True, 250.0)  # NMC battery (higher density)
 
-    LYCOMING_O235 = "lycoming_o235"  # 115 HP gasoline (baseline)
-    LYCOMING_O320 = "lycoming_o320"  # 150 HP gasoline (performance)
-    ELECTRIC_LIFEPO4 = "electric_lifepo4"  # LiFePO4 battery electric
-    ELECTRIC_NMC = "electric_nmc"  # NMC battery electric (higher density)
+    electric: bool
+    wh_per_kg: float
+
+    def __new__(cls, value: str, electric: bool, wh_per_kg: float):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.electric = electric
+        member.wh_per_kg = wh_per_kg
+        return member
 
 
 class GrainConstraint(Enum):
@@ -56,40 +83,98 @@ class GrainConstraint(Enum):
     SPECIFIC = "specific"  # Specific angle required (see grain_angle)
 
 
-@dataclass
-class Ply:
+def _plain(value: Any) -> Any:
+    """Convert a config value into JSON-ready builtins."""
+    if isinstance(value, _FastSerialize):
+        return value.to_dict()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Mapping):
+        return {_plain(key): _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+class _FastSerialize:
+    """Mixin adding ``to_dict()`` driven by a per-class field-name table.
+
+    The table is resolved from ``dataclasses.fields()`` on first use and then
+    stored on the class, so serialization skips the reflection afterwards.
+    Underscore-prefixed fields are internal caches and ``init=False`` fields
+    are derived values; both are left out.
+    """
+
+    __slots__ = ()
+
+    _FIELDS: ClassVar[tuple[str, ...]]
+
+    @classmethod
+    def _field_names(cls) -> tuple[str, ...]:
+        names = cls.__dict__.get("_FIELDS")
+        if names is None:
+            # Only ever mixed into dataclasses
+            dc = cast("type[DataclassInstance]", cls)
+            names = tuple(
+                f.name for f in fields(dc) if f.init and not f.name.startswith("_")
+            )
+            cls._FIELDS = names
+        return names
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to nested builtins (enums as their values)."""
+        return {name: _plain(getattr(self, name)) for name in self._field_names()}
+
+
+@dataclass(frozen=True, slots=True)
+class Ply(_FastSerialize):
     """Single composite ply definition."""
 
     material: str
     orientation: float
-    thickness: Optional[float] = None
+    thickness: float | None = None
 
+    # Lowercased material, the key used against ply thickness lookups
+    _material_key: str = field(init=False, repr=False, compare=False)
 
-@dataclass
-class LaminateDefinition:
+    def __post_init__(self) -> None:
+        # Material names come from a tiny vocabulary ("bid", "uni", ...);
+        # interning lets every ply in a schedule share one string object.
+        object.__setattr__(self, "material", sys.intern(self.material))
+        object.__setattr__(self, "_material_key", sys.intern(self.material.lower()))
+
+
+@dataclass(frozen=True, slots=True)
+class LaminateDefinition(_FastSerialize):
     """Stack of plies used for layups and manufacturing prep."""
 
     name: str
-    plies: List[Ply] = field(default_factory=list)
+    plies: tuple[Ply, ...] = ()
     notes: str = ""
 
-    def total_thickness(self, ply_lookup: Dict[str, float]) -> float:
+    # Per-ply (fixed thickness or None, lookup key), resolved at construction
+    _plan: tuple[tuple[float | None, str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        plan = tuple((ply.thickness, ply._material_key) for ply in self.plies)
+        object.__setattr__(self, "_plan", plan)
+
+    def total_thickness(self, ply_lookup: Mapping[str, float]) -> float:
         """Compute total laminate thickness using a ply thickness lookup."""
         thickness = 0.0
-        for ply in self.plies:
-            base = ply.thickness
-            if base is None:
-                base = ply_lookup.get(ply.material.lower(), 0.0)
-            thickness += base
+        for fixed, material in self._plan:
+            thickness += fixed if fixed is not None else ply_lookup.get(material, 0.0)
         return thickness
 
-    def cut_order_steps(self) -> List[str]:
+    def cut_order_steps(self) -> list[str]:
         """Describe recommended CAM steps for this laminate."""
         return ["engrave_labels", "pocket_features", "profile_cut"]
 
 
-@dataclass
-class GeometricParams:
+@dataclass(frozen=True)
+class GeometricParams(_FastSerialize):
     """Primary aircraft geometry - all dimensions in inches unless noted."""
 
     # === MAIN WING (Eppler 1230 Modified) ===
@@ -123,36 +208,101 @@ class GeometricParams:
     cockpit_width: float = 23.0  # F-22 interior width
     pilot_height_max: float = 77.0  # Max pilot height (inches)
 
-    # === DERIVED DIMENSIONS (computed at runtime) ===
-    @property
-    def canard_arm(self) -> float:
-        """Distance from wing AC to canard AC (critical for stability)."""
+    # === DERIVED DIMENSIONS (computed once in __post_init__) ===
+    canard_arm: float = field(init=False, default=0.0, repr=False, compare=False)
+    wing_area: float = field(init=False, default=0.0, repr=False, compare=False)
+    canard_area: float = field(init=False, default=0.0, repr=False, compare=False)
+    wing_aspect_ratio: float = field(init=False, default=0.0, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived values are written once here, and
+        # dataclasses.replace() recomputes them for modified copies.
         wing_ac = self.fs_wing_le + (self.wing_root_chord * 0.25)
         canard_ac = self.fs_canard_le + (self.canard_root_chord * 0.25)
-        return wing_ac - canard_ac
+        # Distance from wing AC to canard AC (critical for stability)
+        object.__setattr__(self, "canard_arm", wing_ac - canard_ac)
 
-    @property
-    def wing_area(self) -> float:
-        """Wing planform area in square feet."""
-        # Trapezoidal approximation
-        avg_chord = (self.wing_root_chord + self.wing_tip_chord) / 2
-        return (avg_chord * self.wing_span) / 144  # sq in to sq ft
+        # Planform areas in square feet (trapezoidal approximation)
+        wing_avg_chord = (self.wing_root_chord + self.wing_tip_chord) / 2
+        wing_area = (wing_avg_chord * self.wing_span) / 144  # sq in to sq ft
+        object.__setattr__(self, "wing_area", wing_area)
 
-    @property
-    def canard_area(self) -> float:
-        """Canard planform area in square feet."""
-        avg_chord = (self.canard_root_chord + self.canard_tip_chord) / 2
-        return (avg_chord * self.canard_span) / 144
+        canard_avg_chord = (self.canard_root_chord + self.canard_tip_chord) / 2
+        object.__setattr__(
+            self, "canard_area", (canard_avg_chord * self.canard_span) / 144
+        )
 
-    @property
-    def wing_aspect_ratio(self) -> float:
-        """Wing aspect ratio (span² / area)."""
+        # Wing aspect ratio (span² / area)
         span_ft = self.wing_span / 12
-        return (span_ft**2) / self.wing_area
+        object.__setattr__(self, "wing_aspect_ratio", (span_ft**2) / wing_area)
+
+    @cached_property
+    def stations_array(self) -> "np.ndarray":
+        """Fuselage stations nose to tail as a read-only float64 array.
+
+        Lets weight & balance code compute moments with a single dot product.
+        """
+        import numpy as np  # deferred: config imports stay numpy-free
+
+        stations = np.array(
+            [
+                self.fs_nose,
+                self.fs_canard_le,
+                self.fs_pilot_seat,
+                self.fs_rear_seat,
+                self.fs_wing_le,
+                self.fs_firewall,
+                self.fs_tail,
+            ],
+            dtype=np.float64,
+        )
+        stations.flags.writeable = False  # shared via the cache
+        return stations
+
+    @cached_property
+    def stations_delta(self) -> Mapping[str, float]:
+        """Lengths between adjacent fuselage stations (inches), nose to tail."""
+        return MappingProxyType(
+            {
+                "nose_to_canard": self.fs_canard_le - self.fs_nose,
+                "canard_to_pilot": self.fs_pilot_seat - self.fs_canard_le,
+                "pilot_to_rear_seat": self.fs_rear_seat - self.fs_pilot_seat,
+                "rear_seat_to_wing": self.fs_wing_le - self.fs_rear_seat,
+                "wing_to_firewall": self.fs_firewall - self.fs_wing_le,
+                "firewall_to_tail": self.fs_tail - self.fs_firewall,
+            }
+        )
 
 
-@dataclass
-class MaterialParams:
+# Shared, read-only default schedules: built once at import instead of per
+# MaterialParams/ManufacturingParams instance.
+_DEFAULT_LAMINATES = MappingProxyType(
+    {
+        "wing_skin": LaminateDefinition(
+            name="wing_skin",
+            plies=(
+                Ply(material="bid", orientation=45.0),
+                Ply(material="bid", orientation=-45.0),
+                Ply(material="uni", orientation=0.0),
+                Ply(material="bid", orientation=45.0),
+            ),
+            notes="Baseline Long-EZ wing skin schedule",
+        ),
+        "canard_skin": LaminateDefinition(
+            name="canard_skin",
+            plies=(
+                Ply(material="bid", orientation=30.0),
+                Ply(material="bid", orientation=-30.0),
+                Ply(material="bid", orientation=45.0),
+            ),
+            notes="Roncz canard surface layup",
+        ),
+    }
+)
+
+
+@dataclass(frozen=True)
+class MaterialParams(_FastSerialize):
     """Composite layup and foam specifications."""
 
     # === FIBERGLASS PLY THICKNESSES (inches) ===
@@ -169,46 +319,28 @@ class MaterialParams:
     foam_core_thickness: float = 0.5  # PVC foam shell thickness
 
     # === LAMINATE SCHEDULES ===
-    laminates: Dict[str, LaminateDefinition] = field(
-        default_factory=lambda: {
-            "wing_skin": LaminateDefinition(
-                name="wing_skin",
-                plies=[
-                    Ply(material="bid", orientation=45.0),
-                    Ply(material="bid", orientation=-45.0),
-                    Ply(material="uni", orientation=0.0),
-                    Ply(material="bid", orientation=45.0),
-                ],
-                notes="Baseline Long-EZ wing skin schedule",
-            ),
-            "canard_skin": LaminateDefinition(
-                name="canard_skin",
-                plies=[
-                    Ply(material="bid", orientation=30.0),
-                    Ply(material="bid", orientation=-30.0),
-                    Ply(material="bid", orientation=45.0),
-                ],
-                notes="Roncz canard surface layup",
-            ),
-        }
+    laminates: Mapping[str, LaminateDefinition] = field(
+        default_factory=lambda: _DEFAULT_LAMINATES
     )
 
-    @property
+    @cached_property
     def spar_trough_depth(self) -> float:
         """Spar cap trough depth = plies × thickness."""
         return self.spar_cap_plies * self.uni_ply_thickness
 
-    @property
-    def ply_thickness_lookup(self) -> Dict[str, float]:
-        """Map laminate material names to nominal ply thickness."""
-        return {
-            "bid": self.bid_ply_thickness,
-            "uni": self.uni_ply_thickness,
-        }
+    @cached_property
+    def ply_thickness_lookup(self) -> Mapping[str, float]:
+        """Map laminate material names to nominal ply thickness (read-only)."""
+        return MappingProxyType(
+            {
+                "bid": self.bid_ply_thickness,
+                "uni": self.uni_ply_thickness,
+            }
+        )
 
 
-@dataclass
-class ManufacturingIntent:
+@dataclass(frozen=True, slots=True)
+class ManufacturingIntent(_FastSerialize):
     """Describes a manufacturing artifact and its expected fidelity."""
 
     artifact: str
@@ -216,9 +348,15 @@ class ManufacturingIntent:
     tolerance: float
     description: str = ""
 
+    def __post_init__(self) -> None:
+        # Formats ("STL", "DXF", "GCODE") and artifact ids are compared during
+        # CAM routing; interned strings compare by identity.
+        object.__setattr__(self, "format", sys.intern(self.format))
+        object.__setattr__(self, "artifact", sys.intern(self.artifact))
 
-@dataclass
-class ComponentManufacturingIntent:
+
+@dataclass(frozen=True, slots=True)
+class ComponentManufacturingIntent(_FastSerialize):
     """Per-component manufacturing outputs for CAM and templates."""
 
     printable_jigs: ManufacturingIntent
@@ -226,8 +364,94 @@ class ComponentManufacturingIntent:
     sheet_templates: ManufacturingIntent
 
 
-@dataclass
-class ManufacturingParams:
+_DEFAULT_COMPONENT_INTENTS = MappingProxyType(
+    {
+        "wing": ComponentManufacturingIntent(
+            printable_jigs=ManufacturingIntent(
+                artifact="wing_alignment_jig",
+                format="STL",
+                tolerance=0.01,
+                description="3D printed tip/rib fixtures to hold foam cores",
+            ),
+            cnc_foam=ManufacturingIntent(
+                artifact="wing_foam_core",
+                format="GCODE",
+                tolerance=0.02,
+                description="4-axis hot-wire toolpath with kerf offsets",
+            ),
+            sheet_templates=ManufacturingIntent(
+                artifact="wing_root_tip_templates",
+                format="DXF",
+                tolerance=0.01,
+                description="Laser or waterjet templates for foam blanks",
+            ),
+        ),
+        "canard": ComponentManufacturingIntent(
+            printable_jigs=ManufacturingIntent(
+                artifact="canard_alignment_jig",
+                format="STL",
+                tolerance=0.01,
+                description="Roncz canard washout and alignment fixtures",
+            ),
+            cnc_foam=ManufacturingIntent(
+                artifact="canard_foam_core",
+                format="GCODE",
+                tolerance=0.02,
+                description="Hot-wire toolpath honoring Roncz airfoil",
+            ),
+            sheet_templates=ManufacturingIntent(
+                artifact="canard_root_tip_templates",
+                format="DXF",
+                tolerance=0.01,
+                description="Templates for canard foam blocks",
+            ),
+        ),
+        "bulkhead": ComponentManufacturingIntent(
+            printable_jigs=ManufacturingIntent(
+                artifact="bulkhead_jig",
+                format="STL",
+                tolerance=0.01,
+                description="Bonding jigs to hold bulkheads square",
+            ),
+            cnc_foam=ManufacturingIntent(
+                artifact="bulkhead_blank",
+                format="DXF",
+                tolerance=0.02,
+                description="Router-ready outlines for foam or plywood blanks",
+            ),
+            sheet_templates=ManufacturingIntent(
+                artifact="bulkhead_templates",
+                format="DXF",
+                tolerance=0.01,
+                description="Full-size bulkhead profiles for tracing",
+            ),
+        ),
+        "fuselage": ComponentManufacturingIntent(
+            printable_jigs=ManufacturingIntent(
+                artifact="fuselage_assembly_jig",
+                format="STL",
+                tolerance=0.02,
+                description="3D printed pads/locators for longerons and bulkheads",
+            ),
+            cnc_foam=ManufacturingIntent(
+                artifact="fuselage_shell",
+                format="DXF",
+                tolerance=0.03,
+                description="Panel nest files for CNC-routed side and bottom panels",
+            ),
+            sheet_templates=ManufacturingIntent(
+                artifact="fuselage_panel_templates",
+                format="DXF",
+                tolerance=0.02,
+                description="Printable side/bottom templates for manual cutting",
+            ),
+        ),
+    }
+)
+
+
+@dataclass(frozen=True)
+class ManufacturingParams(_FastSerialize):
     """CNC and hot-wire cutting parameters."""
 
     # === HOT-WIRE CUTTING ===
@@ -241,110 +465,38 @@ class ManufacturingParams:
     kerf_urethane: float = 0.035  # Material removed (inches)
 
     # === NESTING / SHEET STOCK ===
-    stock_sheets: List[Tuple[float, float]] = field(
-        default_factory=lambda: [
-            (24.0, 48.0),  # Typical foam block face
-            (48.0, 96.0),  # Full plywood sheet
-        ]
+    stock_sheets: tuple[tuple[float, float], ...] = (
+        (24.0, 48.0),  # Typical foam block face
+        (48.0, 96.0),  # Full plywood sheet
     )
     default_dogbone_radius: float = 0.0625
     default_fillet_radius: float = 0.125
     engraving_depth: float = 0.02
 
     # === FABRICATION INTENT ===
-    component_intents: Dict[str, ComponentManufacturingIntent] = field(
-        default_factory=lambda: {
-            "wing": ComponentManufacturingIntent(
-                printable_jigs=ManufacturingIntent(
-                    artifact="wing_alignment_jig",
-                    format="STL",
-                    tolerance=0.01,
-                    description="3D printed tip/rib fixtures to hold foam cores",
-                ),
-                cnc_foam=ManufacturingIntent(
-                    artifact="wing_foam_core",
-                    format="GCODE",
-                    tolerance=0.02,
-                    description="4-axis hot-wire toolpath with kerf offsets",
-                ),
-                sheet_templates=ManufacturingIntent(
-                    artifact="wing_root_tip_templates",
-                    format="DXF",
-                    tolerance=0.01,
-                    description="Laser or waterjet templates for foam blanks",
-                ),
-            ),
-            "canard": ComponentManufacturingIntent(
-                printable_jigs=ManufacturingIntent(
-                    artifact="canard_alignment_jig",
-                    format="STL",
-                    tolerance=0.01,
-                    description="Roncz canard washout and alignment fixtures",
-                ),
-                cnc_foam=ManufacturingIntent(
-                    artifact="canard_foam_core",
-                    format="GCODE",
-                    tolerance=0.02,
-                    description="Hot-wire toolpath honoring Roncz airfoil",
-                ),
-                sheet_templates=ManufacturingIntent(
-                    artifact="canard_root_tip_templates",
-                    format="DXF",
-                    tolerance=0.01,
-                    description="Templates for canard foam blocks",
-                ),
-            ),
-            "bulkhead": ComponentManufacturingIntent(
-                printable_jigs=ManufacturingIntent(
-                    artifact="bulkhead_jig",
-                    format="STL",
-                    tolerance=0.01,
-                    description="Bonding jigs to hold bulkheads square",
-                ),
-                cnc_foam=ManufacturingIntent(
-                    artifact="bulkhead_blank",
-                    format="DXF",
-                    tolerance=0.02,
-                    description="Router-ready outlines for foam or plywood blanks",
-                ),
-                sheet_templates=ManufacturingIntent(
-                    artifact="bulkhead_templates",
-                    format="DXF",
-                    tolerance=0.01,
-                    description="Full-size bulkhead profiles for tracing",
-                ),
-            ),
-            "fuselage": ComponentManufacturingIntent(
-                printable_jigs=ManufacturingIntent(
-                    artifact="fuselage_assembly_jig",
-                    format="STL",
-                    tolerance=0.02,
-                    description="3D printed pads/locators for longerons and bulkheads",
-                ),
-                cnc_foam=ManufacturingIntent(
-                    artifact="fuselage_shell",
-                    format="DXF",
-                    tolerance=0.03,
-                    description="Panel nest files for CNC-routed side and bottom panels",
-                ),
-                sheet_templates=ManufacturingIntent(
-                    artifact="fuselage_panel_templates",
-                    format="DXF",
-                    tolerance=0.02,
-                    description="Printable side/bottom templates for manual cutting",
-                ),
-            ),
-        }
+    component_intents: Mapping[str, ComponentManufacturingIntent] = field(
+        default_factory=lambda: _DEFAULT_COMPONENT_INTENTS
     )
 
-    @property
-    def kerf_compensation(self) -> Dict[FoamType, float]:
-        """Kerf offset by foam type."""
-        return {
-            FoamType.STYROFOAM_BLUE: self.kerf_styrofoam,
-            FoamType.URETHANE_2LB: self.kerf_urethane,
-            FoamType.DIVINYCELL_H45: 0.030,
-        }
+    @cached_property
+    def stock_sheets_array(self) -> "np.ndarray":
+        """Stock sheet (width, height) pairs as a read-only (N, 2) float64 array."""
+        import numpy as np  # deferred: config imports stay numpy-free
+
+        sheets = np.asarray(self.stock_sheets, dtype=np.float64).reshape(-1, 2)
+        sheets.flags.writeable = False  # shared via the cache
+        return sheets
+
+    @cached_property
+    def kerf_compensation(self) -> Mapping[FoamType, float]:
+        """Kerf offset by foam type (read-only, built once per instance)."""
+        return MappingProxyType(
+            {
+                FoamType.STYROFOAM_BLUE: self.kerf_styrofoam,
+                FoamType.URETHANE_2LB: self.kerf_urethane,
+                FoamType.DIVINYCELL_H45: 0.030,
+            }
+        )
 
     # === FUSELAGE BUILD SETTINGS ===
     fuselage_build_method: BuildMethod = BuildMethod.BOW_FOAM
@@ -357,7 +509,7 @@ class ManufacturingParams:
 
 
 @dataclass
-class StrakeConfig:
+class StrakeConfig(_FastSerialize):
     """Strake geometry for wing-fuselage integration."""
 
     # === GEOMETRY ===
@@ -379,7 +531,7 @@ class StrakeConfig:
 
 
 @dataclass
-class PropulsionConfig:
+class PropulsionConfig(_FastSerialize):
     """Powerplant configuration for CG and firewall generation."""
 
     propulsion_type: PropulsionType = PropulsionType.LYCOMING_O235
@@ -399,30 +551,24 @@ class PropulsionConfig:
     @property
     def is_electric(self) -> bool:
         """Check if propulsion is electric."""
-        return self.propulsion_type in (
-            PropulsionType.ELECTRIC_LIFEPO4,
-            PropulsionType.ELECTRIC_NMC,
-        )
+        return self.propulsion_type.electric
 
     @property
     def battery_energy_density_wh_kg(self) -> float:
         """Energy density based on battery chemistry."""
-        if self.propulsion_type == PropulsionType.ELECTRIC_LIFEPO4:
-            return 150.0  # LiFePO4
-        elif self.propulsion_type == PropulsionType.ELECTRIC_NMC:
-            return 250.0  # NMC
-        return 0.0
+        return self.propulsion_type.wh_per_kg
 
     @property
     def battery_mass_kg(self) -> float:
         """Computed battery mass from capacity and density."""
-        if not self.is_electric:
+        wh_per_kg = self.propulsion_type.wh_per_kg
+        if wh_per_kg == 0.0:
             return 0.0
-        return (self.battery_capacity_kwh * 1000) / self.battery_energy_density_wh_kg
+        return (self.battery_capacity_kwh * 1000) / wh_per_kg
 
 
-@dataclass
-class AirfoilSelection:
+@dataclass(frozen=True, slots=True)
+class AirfoilSelection(_FastSerialize):
     """Airfoil assignments for each lifting surface."""
 
     # SAFETY: Roncz is NON-NEGOTIABLE for the canard
@@ -436,37 +582,122 @@ class AirfoilSelection:
     wing_reflex_percent: float = 2.5
 
 
-@dataclass
-class ComplianceParams:
+# Task credit weights (percentage of 51% rule). Shared, read-only default
+# schedule: built once at import instead of per ComplianceParams instance.
+_DEFAULT_TASK_CREDITS = MappingProxyType(
+    {
+        "wing_cores_cnc": 0.08,  # Builder-operated CNC foam cutting
+        "wing_skins_layup": 0.12,  # Manual fiberglass layup
+        "fuselage_assembly": 0.15,  # Bulkhead installation & bonding
+        "canard_fabrication": 0.10,  # Canard core + skins
+        "control_system": 0.08,  # Linkages, cables, torque tubes
+        "landing_gear": 0.06,  # Main gear bow, nose gear
+        "engine_install": 0.05,  # Engine mount, baffles, cowl
+        "electrical": 0.04,  # Wiring harness
+        "finishing": 0.06,  # Fill, sand, paint
+        "final_assembly": 0.10,  # Systems integration
+    }
+)
+
+
+@dataclass(frozen=True)
+class ComplianceParams(_FastSerialize):
     """FAA 14 CFR 21.191(g) compliance tracking."""
 
-    # Task credit weights (percentage of 51% rule)
-    task_credits: Dict[str, float] = field(
-        default_factory=lambda: {
-            "wing_cores_cnc": 0.08,  # Builder-operated CNC foam cutting
-            "wing_skins_layup": 0.12,  # Manual fiberglass layup
-            "fuselage_assembly": 0.15,  # Bulkhead installation & bonding
-            "canard_fabrication": 0.10,  # Canard core + skins
-            "control_system": 0.08,  # Linkages, cables, torque tubes
-            "landing_gear": 0.06,  # Main gear bow, nose gear
-            "engine_install": 0.05,  # Engine mount, baffles, cowl
-            "electrical": 0.04,  # Wiring harness
-            "finishing": 0.06,  # Fill, sand, paint
-            "final_assembly": 0.10,  # Systems integration
-        }
+    task_credits: Mapping[str, float] = field(
+        default_factory=lambda: _DEFAULT_TASK_CREDITS
     )
 
-    @property
+    @cached_property
     def total_builder_credit(self) -> float:
         """Sum of all builder credits - must exceed 0.50."""
-        return sum(self.task_credits.values())
+        # fsum: exactly rounded, since the total is checked against a hard
+        # 0.51 limit
+        return math.fsum(self.task_credits.values())
+
+
+# Validation rules as (passes(canard_airfoil, total_credit), message) pairs.
+# Messages are str.format templates; adding a rule is appending a pair.
+_VALIDATION_RULES: tuple[tuple[Callable[[AirfoilType, float], bool], str], ...] = (
+    # SAFETY CHECK: Roncz canard is mandatory
+    (
+        lambda canard, credit: canard is AirfoilType.RONCZ_R1145MS,
+        (
+            "SAFETY VIOLATION: Canard must use RONCZ_R1145MS. "
+            "GU25-5(11)8 causes dangerous lift loss in rain."
+        ),
+    ),
+    # COMPLIANCE CHECK: Builder credits must exceed 51%
+    (
+        lambda canard, credit: credit >= 0.51,
+        (
+            "COMPLIANCE VIOLATION: Builder credits ({credit:.1%}) "
+            "below FAA 51% requirement."
+        ),
+    ),
+)
+
+
+def _iter_errors(canard_airfoil: AirfoilType, total_credit: float) -> Iterator[str]:
+    """Yield validation errors for a set of primitive inputs, lazily."""
+    for passes, message in _VALIDATION_RULES:
+        if not passes(canard_airfoil, total_credit):
+            yield message.format(credit=total_credit)
+
+
+@lru_cache(maxsize=32)
+def _validate_impl(canard_airfoil: AirfoilType, total_credit: float) -> tuple[str, ...]:
+    """Collect the validation errors for a set of primitive inputs.
+
+    Memoized: the inputs are hashable and the rules are pure, so repeated
+    validation of an unchanged configuration is a cache lookup.
+    """
+    return tuple(_iter_errors(canard_airfoil, total_credit))
 
 
-@dataclass
-class AircraftConfig:
+# Summary layout, formatted once per configuration instance.
+# Positional %-format spec; field order must match AircraftConfig._summary_text.
+_SUMMARY_FMT = """
+Open-EZ PDE Configuration Summary
+=================================
+Baseline: %s
+Version: %s
+
+GEOMETRY
+--------
+Wing Span: %.1f ft
+Wing Area: %.1f sq ft
+Wing AR: %.2f
+Canard Span: %.1f ft
+Canard Area: %.1f sq ft
+Canard Arm: %.1f in
+
+AIRFOILS
+--------
+Canard: %s (SAFETY CRITICAL)
+Wing: %s
+Wing Reflex: %s%%
+
+MATERIALS
+---------
+Spar Cap Plies: %d
+Spar Trough Depth: %.3f in
+
+COMPLIANCE
+----------
+Builder Credits: %.1f%%
+FAA 51%% Status: %s
+"""
+
+
+@dataclass(frozen=True)
+class AircraftConfig(_FastSerialize):
     """
     Master configuration singleton.
 
+    Frozen: derive variants with dataclasses.replace() rather than mutating
+    the shared instance.
+
     ALL downstream modules import this. Changes here propagate through:
     - CadQuery geometry scripts
     - OpenVSP aerodynamic models
@@ -487,78 +718,61 @@ class AircraftConfig:
     version: str = "0.1.0"
     baseline: str = "Long-EZ Model 61"
 
-    def validate(self) -> List[str]:
-        """Validate configuration for safety and regulatory compliance."""
-        errors = []
-
-        # SAFETY CHECK: Roncz canard is mandatory
-        if self.airfoils.canard != AirfoilType.RONCZ_R1145MS:
-            errors.append(
-                "SAFETY VIOLATION: Canard must use RONCZ_R1145MS. "
-                "GU25-5(11)8 causes dangerous lift loss in rain."
-            )
-
-        # COMPLIANCE CHECK: Builder credits must exceed 51%
-        if self.compliance.total_builder_credit < 0.51:
-            errors.append(
-                f"COMPLIANCE VIOLATION: Builder credits ({self.compliance.total_builder_credit:.1%}) "
-                "below FAA 51% requirement."
-            )
+    def iter_errors(self) -> Iterator[str]:
+        """Yield validation errors lazily, without building a container."""
+        return _iter_errors(self.airfoils.canard, self.compliance.total_builder_credit)
 
-        # STABILITY CHECK: Canard must stall before wing
-        # (simplified check - full analysis requires OpenVSP)
-        canard_loading = 1.0  # placeholder
-        wing_loading = 1.0  # placeholder
-        if canard_loading < wing_loading:
-            errors.append(
-                "STABILITY WARNING: Canard loading may not ensure canard-first stall. "
-                "Run OpenVSP analysis to verify."
-            )
+    def validate(self) -> tuple[str, ...]:
+        """Validate configuration for safety and regulatory compliance."""
+        # Empty tuple (the common, all-clear case) is a shared singleton
+        return _validate_impl(
+            self.airfoils.canard, self.compliance.total_builder_credit
+        )
 
-        return errors
+    @cached_property
+    def _summary_text(self) -> str:
+        """Rendered summary; the frozen config makes it safe to keep."""
+        geo = self.geometry
+        credit = self.compliance.total_builder_credit
+        return _SUMMARY_FMT % (
+            self.baseline,
+            self.version,
+            geo.wing_span / 12,
+            geo.wing_area,
+            geo.wing_aspect_ratio,
+            geo.canard_span / 12,
+            geo.canard_area,
+            geo.canard_arm,
+            _AIRFOIL_STR[self.airfoils.canard],
+            _AIRFOIL_STR[self.airfoils.wing_root],
+            self.airfoils.wing_reflex_percent,
+            self.materials.spar_cap_plies,
+            self.materials.spar_trough_depth,
+            credit * 100,
+            "PASS" if credit >= 0.51 else "FAIL",
+        )
 
     def summary(self) -> str:
         """Generate human-readable configuration summary."""
-        return f"""
-Open-EZ PDE Configuration Summary
-=================================
-Baseline: {self.baseline}
-Version: {self.version}
-
-GEOMETRY
---------
-Wing Span: {self.geometry.wing_span / 12:.1f} ft
-Wing Area: {self.geometry.wing_area:.1f} sq ft
-Wing AR: {self.geometry.wing_aspect_ratio:.2f}
-Canard Span: {self.geometry.canard_span / 12:.1f} ft
-Canard Area: {self.geometry.canard_area:.1f} sq ft
-Canard Arm: {self.geometry.canard_arm:.1f} in
-
-AIRFOILS
---------
-Canard: {self.airfoils.canard.value} (SAFETY CRITICAL)
-Wing: {self.airfoils.wing_root.value}
-Wing Reflex: {self.airfoils.wing_reflex_percent}%
+        return self._summary_text
 
-MATERIALS
----------
-Spar Cap Plies: {self.materials.spar_cap_plies}
-Spar Trough Depth: {self.materials.spar_trough_depth:.3f} in
 
-COMPLIANCE
-----------
-Builder Credits: {self.compliance.total_builder_credit:.1%}
-FAA 51% Status: {"PASS" if self.compliance.total_builder_credit >= 0.51 else "FAIL"}
-"""
+# Singleton instance - import this throughout the project.
+# Built (and validated) lazily on first access via PEP 562 __getattr__, so
+# importing the module for its enums or dataclasses stays cheap.
+def __getattr__(name: str) -> Any:
+    if name != "config":
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
+    instance = AircraftConfig()
 
-# Singleton instance - import this throughout the project
-config = AircraftConfig()
+    # Validate on first access
+    errors = instance.validate()
+    if errors:
+        import warnings
 
-# Validate on import
-_errors = config.validate()
-if _errors:
-    import warnings
+        for err in errors:
+            warnings.warn(err, UserWarning)
 
-    for err in _errors:
-        warnings.warn(err, UserWarning)
+    globals()["config"] = instance
+    return instance
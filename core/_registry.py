@@ -0,0 +1,50 @@
+"""Export registry for the lazy ``core`` package.
+
+Kept in its own dependency-free module so ``core/__init__.py`` stays a thin
+loader and the table has a single source of truth.
+"""
+
+MODULE_MAP: dict[str, str] = {
+    # Base
+    "AircraftComponent": "core.base",
+    # Aerodynamics
+    "AirfoilFactory": "core.aerodynamics",
+    "Airfoil": "core.aerodynamics",
+    "airfoil_factory": "core.aerodynamics",
+    # Structures
+    "WingGenerator": "core.structures",
+    "CanardGenerator": "core.structures",
+    "Fuselage": "core.structures",
+    # Compliance
+    "ComplianceTracker": "core.compliance",
+    "ComplianceTaskTracker": "core.compliance",
+    "TaskRole": "core.compliance",
+    # Manufacturing
+    "GCodeWriter": "core.manufacturing",
+    "JigFactory": "core.manufacturing",
+    "GCodeConfig": "core.manufacturing",
+    "CutPath": "core.manufacturing",
+    # Analysis
+    "PhysicsEngine": "core.analysis",
+    "VSPBridge": "core.analysis",
+    "StabilityMetrics": "core.analysis",
+    "WeightBalance": "core.analysis",
+    "WeightItem": "core.analysis",
+    "physics": "core.analysis",
+    # OpenVSP Runner
+    "OpenVSPRunner": "core.analysis",
+    "AerodynamicPoint": "core.analysis",
+    "AerodynamicSweep": "core.analysis",
+    "TrimSweepResult": "core.analysis",
+    "CLMaxResult": "core.analysis",
+    "StructuralMeshManifest": "core.analysis",
+    "openvsp_runner": "core.analysis",
+}
+
+ALL: tuple[str, ...] = tuple(MODULE_MAP)
+
+# Reverse map: every exported name provided by each submodule
+NAMES_BY_MODULE: dict[str, tuple[str, ...]] = {}
+for _name, _module_name in MODULE_MAP.items():
+    NAMES_BY_MODULE[_module_name] = (*NAMES_BY_MODULE.get(_module_name, ()), _name)
+del _name, _module_name
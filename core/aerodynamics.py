@@ -8,18 +8,30 @@ Handles Selig/Lednicer format parsing and trailing-edge closure.
 SAFETY: Defaults to Roncz R1145MS for canard applications.
 """
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Any, Tuple, Optional
+import hashlib
+import os
+import tempfile
+import warnings
+import zipfile
 import numpy as np
-from scipy.interpolate import CubicSpline
-from scipy.signal import savgol_filter
-import cadquery as cq
 
-from config import config, AirfoilType
+# Only AirfoilType is needed at import (library keys); the config singleton
+# is pulled in by the methods that read it
+from config import AirfoilType
 
+# cadquery (OCCT) and scipy are imported where they are used, so parsing
+# airfoils or importing core stays cheap on hosts that never build CAD.
+if TYPE_CHECKING:
+    import cadquery as cq
 
-@dataclass
+
+# eq=False: the fields are arrays, so identity is the only meaningful equality
+@dataclass(frozen=True, eq=False)
 class AirfoilCoordinates:
     """Raw airfoil coordinate data."""
 
@@ -29,17 +41,76 @@ class AirfoilCoordinates:
     x_lower: np.ndarray
     y_lower: np.ndarray
 
+    # Combined (2, N) x/y contour, built once from the halves
+    _xy: np.ndarray = field(init=False, repr=False, compare=False)
+    # Normalized arc-length parameter, filled on first use by s_norm
+    _s_norm: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        n_upper = len(self.x_upper)
+        xy = np.empty((2, n_upper + len(self.x_lower) - 1), dtype=np.float64)
+        # Upper then lower, reversed; skip first point of reversed lower to
+        # avoid a duplicate LE
+        xy[0, :n_upper] = self.x_upper
+        xy[0, n_upper:] = self.x_lower[::-1][1:]
+        xy[1, :n_upper] = self.y_upper
+        xy[1, n_upper:] = self.y_lower[::-1][1:]
+        xy.flags.writeable = False
+        object.__setattr__(self, "_xy", xy)
+
     @property
     def x(self) -> np.ndarray:
         """Combined x coordinates (upper then lower, reversed, no duplicate LE)."""
-        # Skip first point of reversed lower to avoid duplicate LE
-        return np.concatenate([self.x_upper, self.x_lower[::-1][1:]])
+        return self._xy[0]
 
     @property
     def y(self) -> np.ndarray:
         """Combined y coordinates (upper then lower, reversed, no duplicate LE)."""
-        # Skip first point of reversed lower to avoid duplicate LE
-        return np.concatenate([self.y_upper, self.y_lower[::-1][1:]])
+        return self._xy[1]
+
+    @property
+    def s_norm(self) -> np.ndarray:
+        """Cumulative arc length along the contour, normalized to [0, 1]."""
+        s_norm = self._s_norm
+        if s_norm is None:
+            # Both channels differenced in one pass
+            dx, dy = np.diff(self._xy, axis=1)
+            ds = np.hypot(dx, dy)
+            s = np.concatenate([[0], np.cumsum(ds)])
+            s_norm = s / s[-1]
+            s_norm.flags.writeable = False
+            object.__setattr__(self, "_s_norm", s_norm)
+        return s_norm
+
+
+@lru_cache(maxsize=8)
+def _savgol_kernel(window: int, polyorder: int) -> np.ndarray:
+    """Savitzky-Golay convolution coefficients, computed once per shape."""
+    from scipy.signal import savgol_coeffs
+
+    coeffs = savgol_coeffs(window, polyorder)
+    coeffs.flags.writeable = False
+    return coeffs
+
+
+def _savgol_smooth(y: np.ndarray, window: int, polyorder: int) -> np.ndarray:
+    """
+    Savitzky-Golay smoothing with a cached kernel.
+
+    Matches savgol_filter(y, window, polyorder) (mode="interp"): the interior
+    is one convolution, and the half-window at each end is replaced by the
+    polynomial fitted to the first/last `window` samples.
+    """
+    from scipy.ndimage import convolve1d
+
+    out = convolve1d(y, _savgol_kernel(window, polyorder), mode="constant")
+    half = window // 2
+    i = np.arange(window, dtype=np.float64)
+    out[:half] = np.polyval(np.polyfit(i, y[:window], polyorder), i[:half])
+    out[-half:] = np.polyval(np.polyfit(i, y[-window:], polyorder), i[-half:])
+    return out
 
 
 class Airfoil:
@@ -53,6 +124,12 @@ class Airfoil:
     - Washout and reflex transformations
     """
 
+    # Reflex deflects the trailing 30% of chord
+    REFLEX_START = 0.70
+
+    # Label, or a zero-argument callable formatting it on first read
+    _name: str | Callable[[], str]
+
     def __init__(
         self, coords: AirfoilCoordinates, n_points: int = 200, smooth: bool = True
     ):
@@ -64,59 +141,134 @@ class Airfoil:
             n_points: Number of points for resampled spline
             smooth: Apply Savitzky-Golay noise filtering
         """
-        self.name = coords.name
-        self._raw = coords
+        self._name = coords.name
+        self._raw_src: AirfoilCoordinates | Callable[[], AirfoilCoordinates] = coords
         self._n_points = n_points
 
-        # Process coordinates
-        self._x, self._y = self._process_coordinates(coords, n_points, smooth)
+        # CAD objects per chord; coordinates never change after construction
+        self._wire_cache: dict = {}
+        self._face_cache: dict = {}
+
+        # Process coordinates into one (2, N) x/y block
+        self._xy = self._process_coordinates(coords, n_points, smooth)
 
         # Ensure closed trailing edge
         self._close_trailing_edge()
 
-    def _process_coordinates(
-        self, coords: AirfoilCoordinates, n_points: int, smooth: bool
-    ) -> Tuple[np.ndarray, np.ndarray]:
-        """Apply spline interpolation and optional smoothing."""
+        # Instances are shared through the load caches: freeze the contour
+        self._xy.flags.writeable = False
+
+    @classmethod
+    def _from_processed(
+        cls,
+        name: str | Callable[[], str],
+        xy: np.ndarray,
+        n_points: int,
+        raw: AirfoilCoordinates | Callable[[], AirfoilCoordinates],
+    ) -> "Airfoil":
+        """
+        Wrap already-resampled coordinates without refitting the splines.
+
+        Used by the shape transforms (washout, reflex, blend), whose output
+        is still on the parent's resampled grid. `name` and `raw` may be
+        zero-argument callables, resolved on first read of the name and _raw
+        properties.
+        """
+        airfoil = cls.__new__(cls)
+        airfoil._name = name
+        airfoil._raw_src = raw
+        airfoil._n_points = n_points
+        airfoil._wire_cache = {}
+        airfoil._face_cache = {}
+        airfoil._xy = xy
+        airfoil._close_trailing_edge()
+        airfoil._xy.flags.writeable = False
+        return airfoil
+
+    @property
+    def name(self) -> str:
+        """Airfoil label; derived names are formatted on first access."""
+        name = self._name
+        if not isinstance(name, str):
+            name = self._name = name()
+        return name
+
+    @property
+    def _raw(self) -> AirfoilCoordinates:
+        """Source coordinates; parsed on first access for disk-cached loads."""
+        raw = self._raw_src
+        if not isinstance(raw, AirfoilCoordinates):
+            raw = self._raw_src = raw()
+        return raw
+
+    def _derived_name(self, template: str, *args: Any) -> Callable[[], str]:
+        """
+        Defer formatting a transform's name until it is read.
+
+        Captures the parent's name (or its pending callable) rather than the
+        parent itself, so chained transforms do not keep ancestors alive.
+        """
+        base = self._name
+
+        def resolve() -> str:
+            parent = base if isinstance(base, str) else base()
+            return template.format(parent, *args)
+
+        return resolve
 
-        # Create parameter t based on cumulative arc length
-        x_raw = coords.x
-        y_raw = coords.y
+    @property
+    def _x(self) -> np.ndarray:
+        """Processed x coordinates (row view of the x/y block)."""
+        return self._xy[0]
 
-        # Calculate arc-length parameterization
-        dx = np.diff(x_raw)
-        dy = np.diff(y_raw)
-        ds = np.sqrt(dx**2 + dy**2)
-        s = np.concatenate([[0], np.cumsum(ds)])
-        s_norm = s / s[-1]  # Normalize to [0, 1]
+    @property
+    def _y(self) -> np.ndarray:
+        """Processed y coordinates (row view of the x/y block)."""
+        return self._xy[1]
 
-        # Fit cubic splines
-        cs_x = CubicSpline(s_norm, x_raw)
-        cs_y = CubicSpline(s_norm, y_raw)
+    def _process_coordinates(
+        self, coords: AirfoilCoordinates, n_points: int, smooth: bool
+    ) -> np.ndarray:
+        """Apply spline interpolation and optional smoothing; returns (2, N)."""
+        from scipy.interpolate import CubicSpline
+
+        # Parameterize by cumulative arc length, memoized on the raw
+        # coordinates so each n_points/smooth variant reuses it. Fit one cubic
+        # spline over both channels: the knot system is shared, so it is
+        # factorized once and solved for x and y together
+        spline = CubicSpline(coords.s_norm, coords._xy, axis=1)
 
         # Resample at uniform parameter intervals
         t_new = np.linspace(0, 1, n_points)
-        x_new = cs_x(t_new)
-        y_new = cs_y(t_new)
+        xy = np.ascontiguousarray(spline(t_new))
 
         # Apply Savitzky-Golay filter to remove digitization noise
         if smooth and n_points >= 11:
             window = min(11, n_points // 2 * 2 - 1)  # Must be odd
-            y_new = savgol_filter(y_new, window, 3)
+            xy[1] = _savgol_smooth(xy[1], window, 3)
 
-        return x_new, y_new
+        return xy
 
     def _close_trailing_edge(self) -> None:
         """Ensure trailing edge is closed (upper meets lower)."""
-        # Average the first and last y-values if they differ
-        if abs(self._y[0] - self._y[-1]) > 1e-6:
-            y_te = (self._y[0] + self._y[-1]) / 2
-            self._y[0] = y_te
-            self._y[-1] = y_te
+        # Average the first and last y-values if they differ; compare as
+        # Python floats to skip NumPy scalar boxing on every construction
+        y_first, y_last = self._y[0].item(), self._y[-1].item()
+        if abs(y_first - y_last) > 1e-6:
+            self._y[0] = self._y[-1] = (y_first + y_last) / 2
 
     @property
     def coordinates(self) -> Tuple[np.ndarray, np.ndarray]:
-        """Return processed (x, y) coordinates."""
+        """
+        Return processed (x, y) coordinates as read-only views.
+
+        Airfoils are shared through the load caches, so the contour is frozen
+        at construction; use coordinates_copy() to get arrays you can modify.
+        """
+        return self._x, self._y
+
+    def coordinates_copy(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return independent, writable copies of the (x, y) coordinates."""
         return self._x.copy(), self._y.copy()
 
     def apply_washout(self, angle_deg: float) -> "Airfoil":
@@ -134,24 +286,33 @@ class Airfoil:
         # in the standard rotation matrix.
         theta = np.radians(-angle_deg)  # Negate for CW rotation
         cos_t, sin_t = np.cos(theta), np.sin(theta)
-
-        # Rotate about quarter-chord (x=0.25)
-        x_pivot = 0.25
-        x_shifted = self._x - x_pivot
-        y_shifted = self._y
-
-        x_rot = x_shifted * cos_t + y_shifted * sin_t + x_pivot
-        y_rot = -x_shifted * sin_t + y_shifted * cos_t
-
-        # Create new instance with rotated coordinates
-        new_coords = AirfoilCoordinates(
-            name=f"{self.name}_washout_{angle_deg}deg",
-            x_upper=x_rot[: len(x_rot) // 2],
-            y_upper=y_rot[: len(y_rot) // 2],
-            x_lower=x_rot[len(x_rot) // 2 :][::-1],
-            y_lower=y_rot[len(y_rot) // 2 :][::-1],
+        rotation = np.array([[cos_t, sin_t], [-sin_t, cos_t]])
+
+        # Rotate about quarter-chord (x=0.25) in a single matrix product
+        pivot = np.array([[0.25], [0.0]])
+        rotated = rotation @ (self._xy - pivot) + pivot
+
+        # Rotation keeps the points on the resampled grid: no spline refit
+        return Airfoil._from_processed(
+            self._derived_name("{}_washout_{}deg", angle_deg),
+            rotated,
+            self._n_points,
+            self._raw_src,
         )
-        return Airfoil(new_coords, self._n_points, smooth=False)
+
+    @cached_property
+    def _reflex_ramp(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Points aft of REFLEX_START and their linear 0 -> 1 ramp to the TE.
+
+        Depends only on x, which never changes after construction, so a
+        sweep over reflex amounts reuses it and each candidate is one
+        scaled add.
+        """
+        x = self._x
+        aft = x > self.REFLEX_START
+        ramp = (x[aft] - self.REFLEX_START) / (1.0 - self.REFLEX_START)
+        return aft, ramp
 
     def apply_reflex(self, percent: float) -> "Airfoil":
         """
@@ -164,26 +325,18 @@ class Airfoil:
             New Airfoil instance with reflex applied
         """
         # Reflex modification: deflect trailing 30% of chord upward
-        reflex_start = 0.70
         reflex_amount = percent / 100.0
 
-        x_new = self._x.copy()
-        y_new = self._y.copy()
-
-        for i in range(len(x_new)):
-            if x_new[i] > reflex_start:
-                # Linear ramp from reflex_start to trailing edge
-                t = (x_new[i] - reflex_start) / (1.0 - reflex_start)
-                y_new[i] += reflex_amount * t  # Linear ramp, not parabolic
-
-        new_coords = AirfoilCoordinates(
-            name=f"{self.name}_reflex_{percent}pct",
-            x_upper=x_new[: len(x_new) // 2],
-            y_upper=y_new[: len(y_new) // 2],
-            x_lower=x_new[len(x_new) // 2 :][::-1],
-            y_lower=y_new[len(y_new) // 2 :][::-1],
+        xy = self._xy.copy()  # x is unchanged by reflex
+        aft, ramp = self._reflex_ramp
+        xy[1, aft] += reflex_amount * ramp  # Linear ramp, not parabolic
+
+        return Airfoil._from_processed(
+            self._derived_name("{}_reflex_{}pct", percent),
+            xy,
+            self._n_points,
+            self._raw_src,
         )
-        return Airfoil(new_coords, self._n_points, smooth=False)
 
     def blend(self, other: "Airfoil", fraction: float) -> "Airfoil":
         """
@@ -205,28 +358,23 @@ class Airfoil:
         if len(self._x) != len(other._x):
             # Resample other to match self's point count
             from scipy.interpolate import interp1d
+
             t_self = np.linspace(0, 1, len(self._x))
             t_other = np.linspace(0, 1, len(other._x))
-            fx = interp1d(t_other, other._x, kind='linear')
-            fy = interp1d(t_other, other._y, kind='linear')
-            other_x = fx(t_self)
-            other_y = fy(t_self)
+            other_xy = interp1d(t_other, other._xy, kind="linear", axis=1)(t_self)
         else:
-            other_x = other._x
-            other_y = other._y
-
-        x_blend = (1 - fraction) * self._x + fraction * other_x
-        y_blend = (1 - fraction) * self._y + fraction * other_y
-
-        half = len(x_blend) // 2
-        new_coords = AirfoilCoordinates(
-            name=f"{self.name}_blend_{fraction:.2f}",
-            x_upper=x_blend[:half],
-            y_upper=y_blend[:half],
-            x_lower=x_blend[half:][::-1],
-            y_lower=y_blend[half:][::-1],
+            other_xy = other._xy
+
+        xy_blend = (1 - fraction) * self._xy + fraction * other_xy
+
+        # The blend already lies on the resampled grid: wrap it directly
+        # instead of splitting into halves and refitting the splines
+        return Airfoil._from_processed(
+            self._derived_name("{}_blend_{:.2f}", fraction),
+            xy_blend,
+            xy_blend.shape[1],
+            self._raw_src,
         )
-        return Airfoil(new_coords, self._n_points, smooth=False)
 
     def scale(self, chord: float) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -238,9 +386,10 @@ class Airfoil:
         Returns:
             Tuple of (x, y) arrays scaled to chord
         """
-        return self._x * chord, self._y * chord
+        x_scaled, y_scaled = self._xy * chord
+        return x_scaled, y_scaled
 
-    def get_cadquery_wire(self, chord: float) -> cq.Wire:
+    def get_cadquery_wire(self, chord: float) -> "cq.Wire":
         """
         Generate CadQuery wire at specified chord.
 
@@ -248,18 +397,34 @@ class Airfoil:
             chord: Chord length in inches
 
         Returns:
-            CadQuery Wire object representing the airfoil profile
+            CadQuery Wire object representing the airfoil profile. Each call
+            returns its own copy, so in-place move()/locate() on it cannot
+            affect other users of a shared Airfoil.
         """
+        return self._cached_wire(chord).copy()
+
+    def _cached_wire(self, chord: float) -> "cq.Wire":
+        """Build the profile wire once per chord; callers must not mutate it."""
+        cached = self._wire_cache.get(chord)
+        if cached is not None:
+            return cached
+
+        import cadquery as cq
+
         x_scaled, y_scaled = self.scale(chord)
 
         # Build list of 3D points (in XY plane, Z=0)
-        points = [(float(x), float(y), 0.0) for x, y in zip(x_scaled, y_scaled)]
+        xyz = np.zeros((len(x_scaled), 3), dtype=np.float64)
+        xyz[:, 0] = x_scaled
+        xyz[:, 1] = y_scaled
+        points = list(map(tuple, xyz.tolist()))
 
         # Create spline through points
         wire = cq.Workplane("XY").spline(points, includeCurrent=False).close().wire()
-        return wire.val()
+        self._wire_cache[chord] = wire = wire.val()
+        return wire
 
-    def get_cadquery_face(self, chord: float) -> cq.Face:
+    def get_cadquery_face(self, chord: float) -> "cq.Face":
         """
         Generate CadQuery face (filled airfoil) at specified chord.
 
@@ -267,10 +432,203 @@ class Airfoil:
             chord: Chord length in inches
 
         Returns:
-            CadQuery Face object
+            CadQuery Face object (a copy, like get_cadquery_wire)
         """
-        wire = self.get_cadquery_wire(chord)
-        return cq.Face.makeFromWires(wire)
+        face = self._face_cache.get(chord)
+        if face is None:
+            import cadquery as cq
+
+            face = cq.Face.makeFromWires(self._cached_wire(chord))
+            self._face_cache[chord] = face
+        return face.copy()
+
+
+def _orient_le_to_te(section: np.ndarray) -> np.ndarray:
+    """Return an (N, 2) section running LE -> TE, flipping whole rows once."""
+    if len(section) > 1 and section[0, 0] > section[-1, 0]:
+        return section[::-1]
+    return section
+
+
+def _lednicer_counts(coords: np.ndarray) -> Optional[Tuple[int, int]]:
+    """
+    Return the (N_upper, N_lower) header of a Lednicer file, or None.
+
+    Lednicer files open with a point-count row. Selig files with
+    unnormalized coordinates (chord in mm or inches) can also start above
+    x = 1, so the row only counts as a header when both values are whole
+    numbers that account for every remaining row.
+    """
+    if len(coords) < 2:
+        return None
+    n_upper, n_lower = coords[0]
+    if n_upper < 1 or n_lower < 1 or n_upper % 1 or n_lower % 1:
+        return None
+    if n_upper + n_lower != len(coords) - 1:
+        return None
+    return int(n_upper), int(n_lower)
+
+
+@lru_cache(maxsize=32)
+def _parse_dat_cached(path_str: str, mtime_ns: int) -> AirfoilCoordinates:
+    """
+    Parse a UIUC .dat file once per (path, mtime).
+
+    Keyed on the resolved path and modification time so every factory in the
+    process shares the parse, and an edited file is re-read. The arrays are
+    read-only because the coordinates instance is shared, which also lets its
+    memoized arc length serve every n_points/smooth variant.
+    """
+    with open(path_str, "r") as f:
+        # First line is typically the name
+        name = f.readline().strip()
+        body = f.tell()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # empty/ragged input is handled below
+            try:
+                # Fast path: C-level parse of a clean two-column body
+                coords = np.loadtxt(f, comments="#", usecols=(0, 1), ndmin=2)
+            except ValueError:
+                # Stray text or short rows: parse leniently and drop them
+                f.seek(body)
+                coords = np.genfromtxt(
+                    f, comments="#", usecols=(0, 1), invalid_raise=False
+                )
+                coords = np.atleast_2d(coords)
+                coords = coords[~np.isnan(coords).any(axis=1)]
+
+    counts = _lednicer_counts(coords)
+    if counts is not None:
+        n_upper, _ = counts
+        upper = _orient_le_to_te(coords[1 : 1 + n_upper])
+        lower = _orient_le_to_te(coords[1 + n_upper :])
+        if len(upper) + len(lower) < 10:
+            raise ValueError(f"Insufficient coordinate data in {path_str}")
+        x_upper, y_upper = upper[:, 0], upper[:, 1]
+        x_lower, y_lower = lower[:, 0], lower[:, 1]
+    else:
+        if len(coords) < 10:
+            raise ValueError(f"Insufficient coordinate data in {path_str}")
+
+        x_all = coords[:, 0]
+        y_all = coords[:, 1]
+
+        # Selig: single loop TE -> upper -> LE -> lower -> TE
+        le_idx = np.argmin(x_all)
+
+        x_upper = x_all[: le_idx + 1][::-1]  # Reverse to go from LE to TE
+        y_upper = y_all[: le_idx + 1][::-1]
+        x_lower = x_all[le_idx:]
+        y_lower = y_all[le_idx:]
+
+    for arr in (x_upper, y_upper, x_lower, y_lower):
+        arr.flags.writeable = False
+    return AirfoilCoordinates(
+        name=name,
+        x_upper=x_upper,
+        y_upper=y_upper,
+        x_lower=x_lower,
+        y_lower=y_lower,
+    )
+
+
+def _disk_cache_enabled() -> bool:
+    """Whether PDE_AIRFOIL_CACHE=1 opts in to the persisted contour cache."""
+    return os.environ.get("PDE_AIRFOIL_CACHE") == "1"
+
+
+@lru_cache(maxsize=64)
+def _load_airfoil_cached(
+    path_str: str, mtime_ns: int, n_points: int, smooth: bool, persist: bool
+) -> "Airfoil":
+    """
+    Build the processed Airfoil for a .dat file once per process.
+
+    Keyed on (path, mtime) like _parse_dat_cached, so an edited file is
+    reloaded; maxsize bounds growth during n_points sweeps. lru_cache does
+    not lock around the build: two threads missing the same key both build
+    it, and the loser gets an instance the cache does not keep.
+
+    With persist (PDE_AIRFOIL_CACHE=1, read by the caller so toggling it
+    takes effect immediately) the resampled contour is also persisted to the
+    user cache directory, so repeat runs skip the parse, spline and
+    smoothing passes.
+    """
+    if not persist:
+        return Airfoil(_parse_dat_cached(path_str, mtime_ns), n_points, smooth)
+
+    disk_path = _processed_cache_path(path_str, mtime_ns, n_points, smooth)
+    cached = _read_processed(disk_path, n_points)
+    if cached is not None:
+        name, xy = cached
+        # The raw coordinates are only parsed if something asks for them
+        raw = partial(_parse_dat_cached, path_str, mtime_ns)
+        return Airfoil._from_processed(name, xy, n_points, raw)
+
+    airfoil = Airfoil(_parse_dat_cached(path_str, mtime_ns), n_points, smooth)
+    _write_processed(disk_path, airfoil.name, airfoil._xy)
+    return airfoil
+
+
+# Bump when resampling or smoothing changes so stale contours are not reused
+_PROCESSED_CACHE_VERSION = 3
+
+
+def _processed_cache_path(
+    path_str: str, mtime_ns: int, n_points: int, smooth: bool
+) -> Path:
+    """Location of the persisted (2, N) contour for one load variant."""
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    source = hashlib.sha1(path_str.encode()).hexdigest()[:12]
+    # Variant fields first, so stale versions of one variant share a prefix
+    name = (
+        f"{Path(path_str).stem}_{source}_{n_points}_{int(smooth)}_{mtime_ns}"
+        f"_v{_PROCESSED_CACHE_VERSION}.npz"
+    )
+    return Path(cache_root) / "openez" / "airfoils" / name
+
+
+def _read_processed(path: Path, n_points: int) -> Optional[Tuple[str, np.ndarray]]:
+    """Load a persisted (name, contour), or None if missing or unusable."""
+    try:
+        with np.load(path) as data:
+            name = str(data["name"])
+            xy = np.array(data["xy"], dtype=np.float64)
+    except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+        return None
+    return (name, xy) if xy.shape == (2, n_points) else None
+
+
+def _write_processed(path: Path, name: str, xy: np.ndarray) -> None:
+    """Persist a contour atomically; the disk cache is best-effort."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a sibling temp file and rename so concurrent runs never
+        # observe a torn archive
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, name=np.array(name), xy=xy)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        # Contours for older mtimes or cache versions of the same variant are
+        # never read again; drop them so edits do not leave orphans behind
+        variant = path.name.rsplit("_", 2)[0] + "_"
+        for stale in path.parent.iterdir():
+            if stale.name.startswith(variant) and stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _file_cache_key(filepath: Path) -> Tuple[str, int]:
+    """Return the (resolved path, mtime_ns) key used by the parse caches."""
+    if not filepath.exists():
+        raise FileNotFoundError(f"Airfoil data file not found: {filepath}")
+    return str(filepath.resolve()), filepath.stat().st_mtime_ns
 
 
 class AirfoilFactory:
@@ -301,7 +659,6 @@ class AirfoilFactory:
             data_dir: Override default airfoil data directory
         """
         self.data_dir = data_dir or self.DATA_DIR
-        self._cache: dict = {}
 
     def load(
         self, airfoil_type: AirfoilType, n_points: int = 200, smooth: bool = True
@@ -321,20 +678,14 @@ class AirfoilFactory:
             FileNotFoundError: If .dat file not found
             ValueError: If file format is invalid
         """
-        cache_key = (airfoil_type, n_points, smooth)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
         filename = self.AIRFOIL_FILES.get(airfoil_type)
         if filename is None:
             raise ValueError(f"Unknown airfoil type: {airfoil_type}")
 
-        filepath = self.data_dir / filename
-        coords = self._parse_dat_file(filepath)
-        airfoil = Airfoil(coords, n_points, smooth)
-
-        self._cache[cache_key] = airfoil
-        return airfoil
+        filepath = Path(self.data_dir) / filename
+        return _load_airfoil_cached(
+            *_file_cache_key(filepath), n_points, smooth, _disk_cache_enabled()
+        )
 
     def load_from_file(
         self, filepath: Path, n_points: int = 200, smooth: bool = True
@@ -350,64 +701,19 @@ class AirfoilFactory:
         Returns:
             Processed Airfoil object
         """
-        coords = self._parse_dat_file(filepath)
-        return Airfoil(coords, n_points, smooth)
+        return _load_airfoil_cached(
+            *_file_cache_key(filepath), n_points, smooth, _disk_cache_enabled()
+        )
 
     def _parse_dat_file(self, filepath: Path) -> AirfoilCoordinates:
         """
         Parse UIUC-format .dat file.
 
         Handles both Selig (single section, LE at x=0) and
-        Lednicer (upper/lower sections) formats.
+        Lednicer (upper/lower sections) formats. The parse itself is cached
+        process-wide; see _parse_dat_cached.
         """
-        if not filepath.exists():
-            raise FileNotFoundError(f"Airfoil data file not found: {filepath}")
-
-        with open(filepath, "r") as f:
-            lines = f.readlines()
-
-        # First line is typically the name
-        name = lines[0].strip()
-
-        # Parse coordinates
-        coords = []
-        for line in lines[1:]:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            parts = line.split()
-            if len(parts) >= 2:
-                try:
-                    x = float(parts[0])
-                    y = float(parts[1])
-                    coords.append((x, y))
-                except ValueError:
-                    continue
-
-        if len(coords) < 10:
-            raise ValueError(f"Insufficient coordinate data in {filepath}")
-
-        coords = np.array(coords)
-        x_all = coords[:, 0]
-        y_all = coords[:, 1]
-
-        # Detect format: Selig has LE near index 0, Lednicer has section break
-        # For now, assume Selig format (most common)
-        le_idx = np.argmin(x_all)
-
-        x_upper = x_all[: le_idx + 1][::-1]  # Reverse to go from LE to TE
-        y_upper = y_all[: le_idx + 1][::-1]
-        x_lower = x_all[le_idx:]
-        y_lower = y_all[le_idx:]
-
-        return AirfoilCoordinates(
-            name=name,
-            x_upper=x_upper,
-            y_upper=y_upper,
-            x_lower=x_lower,
-            y_lower=y_lower,
-        )
+        return _parse_dat_cached(*_file_cache_key(filepath))
 
     def get_canard_airfoil(self) -> Airfoil:
         """
@@ -415,10 +721,10 @@ class AirfoilFactory:
 
         This is a convenience method that enforces the safety requirement.
         """
+        from config import config
+
         # Verify config hasn't been tampered with
         if config.airfoils.canard != AirfoilType.RONCZ_R1145MS:
-            import warnings
-
             warnings.warn(
                 "SAFETY: Overriding canard airfoil to Roncz R1145MS. "
                 "GU25-5(11)8 is unsafe in rain.",
@@ -437,6 +743,8 @@ class AirfoilFactory:
         Returns:
             Processed Airfoil object
         """
+        from config import config
+
         airfoil = self.load(config.airfoils.wing_root)
 
         if apply_reflex and config.airfoils.wing_reflex_percent > 0:
@@ -13,12 +13,45 @@ Key Metrics:
 
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 import json
 import logging
 import math
-from config import config
+import numpy as np
+from config import config, AirfoilType
+
+if TYPE_CHECKING:
+    from config.aircraft_config import GeometricParams
+
+# Optional: orjson is a much faster encoder for the validation caches
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+_TWO_PI = 2 * math.pi
+
+# Stable static margin band (fraction of MAC), shared by the scalar and batch
+# stability checks: 5% minimum stability, 20% for handling qualities
+_MIN_STATIC_MARGIN = 0.05
+_MAX_STATIC_MARGIN = 0.20
 
 
 @dataclass
@@ -74,19 +107,31 @@ class WeightBalance:
 
     items: List[WeightItem] = field(default_factory=list)
 
+    def _totals(self) -> Tuple[float, float]:
+        """(total weight, total moment) accumulated in a single pass."""
+        weight = moment = 0.0
+        for item in self.items:
+            weight += item.weight
+            moment += item.weight * item.arm
+        return weight, moment
+
     @property
     def total_weight(self) -> float:
-        return sum(item.weight for item in self.items)
+        return self._totals()[0]
 
     @property
     def total_moment(self) -> float:
-        return sum(item.moment for item in self.items)
+        return self._totals()[1]
 
     @property
     def cg_location(self) -> float:
-        if self.total_weight == 0:
+        return self._cg(*self._totals())
+
+    @staticmethod
+    def _cg(weight: float, moment: float) -> float:
+        if weight == 0:
             return 0.0
-        return self.total_moment / self.total_weight
+        return moment / weight
 
     def add_item(self, name: str, weight: float, arm: float, category: str = "fixed"):
         self.items.append(WeightItem(name, weight, arm, category))
@@ -101,12 +146,14 @@ class WeightBalance:
                 f"{item.name:<25} {item.weight:>8.1f} {item.arm:>8.1f} {item.moment:>10.1f}"
             )
 
+        total_weight, total_moment = self._totals()
+        cg = self._cg(total_weight, total_moment)
         lines.append("-" * 40)
         lines.append(
-            f"{'TOTAL':<25} {self.total_weight:>8.1f} {self.cg_location:>8.1f} {self.total_moment:>10.1f}"
+            f"{'TOTAL':<25} {total_weight:>8.1f} {cg:>8.1f} {total_moment:>10.1f}"
         )
         lines.append("")
-        lines.append(f"Center of Gravity: {self.cg_location:.2f} in (FS)")
+        lines.append(f"Center of Gravity: {cg:.2f} in (FS)")
 
         return "\n".join(lines)
 
@@ -123,6 +170,10 @@ class PhysicsEngine:
         self.geo = config.geometry
         self._weight_balance = WeightBalance()
         self._init_standard_weights()
+        # (geometry, strake planform, result) of the last MAC / NP solve;
+        # geometry is frozen, so an identity match means the inputs are unchanged
+        self._mac_memo: Optional[Tuple[Any, Any, Tuple[float, float]]] = None
+        self._np_memo: Optional[Tuple[Any, Tuple[float, float], float]] = None
 
     def _init_standard_weights(self):
         """Initialize standard Long-EZ weight items."""
@@ -149,6 +200,22 @@ class PhysicsEngine:
         Returns:
             Tuple of (MAC length, MAC leading edge FS location)
         """
+        strake_cfg = config.strakes if hasattr(config, 'strakes') else None
+        strake_key = (
+            None
+            if strake_cfg is None
+            else (strake_cfg.fs_leading_edge, strake_cfg.fs_trailing_edge)
+        )
+        memo = self._mac_memo
+        if memo is not None and memo[0] is self.geo and memo[1] == strake_key:
+            return memo[2]
+
+        result = self._solve_mac(strake_cfg)
+        self._mac_memo = (self.geo, strake_key, result)
+        return result
+
+    def _solve_mac(self, strake_cfg: Optional[Any]) -> Tuple[float, float]:
+        """Piecewise strake + outer-wing MAC; see calculate_mac."""
         cr = self.geo.wing_root_chord
         ct = self.geo.wing_tip_chord
         taper = ct / cr
@@ -173,7 +240,6 @@ class PhysicsEngine:
         # === Strake segment ===
         # The strakes extend from the fuselage to BL 23.3, contributing
         # significant lifting area near the root.
-        strake_cfg = config.strakes if hasattr(config, 'strakes') else None
         if strake_cfg is not None:
             strake_span = 23.3  # BL at wing root junction
             strake_chord_inboard = strake_cfg.fs_trailing_edge - strake_cfg.fs_leading_edge
@@ -222,13 +288,24 @@ class PhysicsEngine:
         - x_ac = aerodynamic center location
         - eta = canard efficiency factor
         """
+        mac_result = self.calculate_mac()
+        memo = self._np_memo
+        if memo is not None and memo[0] is self.geo and memo[1] == mac_result:
+            return memo[2]
+
+        np_location = self._solve_neutral_point(mac_result)
+        self._np_memo = (self.geo, mac_result, np_location)
+        return np_location
+
+    def _solve_neutral_point(self, mac_result: Tuple[float, float]) -> float:
+        """Lift-weighted NP from both surfaces; see calculate_neutral_point."""
         # Areas (sq ft)
         s_wing = self.geo.wing_area
         s_canard = self.geo.canard_area
 
         # Aerodynamic Centers
         # For swept wings, AC is approximately at 25% MAC, not 25% root chord
-        mac_wing, x_mac_le_wing = self.calculate_mac()
+        mac_wing, x_mac_le_wing = mac_result
         ac_wing = x_mac_le_wing + 0.25 * mac_wing
 
         # Canard AC (simpler - less sweep)
@@ -263,14 +340,8 @@ class PhysicsEngine:
         beta_sq = 1.0
 
         # Lift curve slopes (per radian) with sweep correction
-        a_wing = (
-            2 * math.pi * ar_wing
-            / (2 + math.sqrt(4 + ar_wing**2 * (1 + tan_sweep_half_wing**2 / beta_sq)))
-        )
-        a_canard = (
-            2 * math.pi * ar_canard
-            / (2 + math.sqrt(4 + ar_canard**2 * (1 + tan_sweep_half_canard**2 / beta_sq)))
-        )
+        a_wing = self._swept_lift_slope(ar_wing, tan_sweep_half_wing, beta_sq)
+        a_canard = self._swept_lift_slope(ar_canard, tan_sweep_half_canard, beta_sq)
 
         # Canard efficiency factor (B3 fix)
         # For a canard configuration, the canard sees clean freestream air
@@ -294,6 +365,15 @@ class PhysicsEngine:
         np_location = numerator / denominator
         return np_location
 
+    @staticmethod
+    def _swept_lift_slope(
+        aspect_ratio: float, tan_sweep_half: float, beta_sq: float
+    ) -> float:
+        """Anderson eq. 5.69 lift curve slope (per radian) for a swept wing."""
+        return _TWO_PI * aspect_ratio / (
+            2 + math.sqrt(4 + aspect_ratio**2 * (1 + tan_sweep_half**2 / beta_sq))
+        )
+
     def calculate_cg_envelope(self, engine_weight: float = 250.0) -> StabilityMetrics:
         """
         Calculate complete stability metrics including CG envelope.
@@ -307,10 +387,8 @@ class PhysicsEngine:
         # Get current CG from weight & balance
         cg = self._weight_balance.cg_location
 
-        # Calculate neutral point
+        # Calculate neutral point and MAC (memoized per geometry)
         np_loc = self.calculate_neutral_point()
-
-        # Calculate MAC
         mac, _ = self.calculate_mac()
 
         # Static margin (positive = stable)
@@ -319,19 +397,43 @@ class PhysicsEngine:
         # CG limits (based on static margin requirements)
         # Forward limit: 20% margin (handling qualities)
         # Aft limit: 5% margin (minimum stability)
-        cg_range_fwd = np_loc - 0.20 * mac
-        cg_range_aft = np_loc - 0.05 * mac
+        cg_range_fwd = np_loc - _MAX_STATIC_MARGIN * mac
+        cg_range_aft = np_loc - _MIN_STATIC_MARGIN * mac
 
         return StabilityMetrics(
             cg_location=cg,
             neutral_point=np_loc,
             static_margin=margin * 100.0,
-            is_stable=(0.05 <= margin <= 0.20),
+            is_stable=(_MIN_STATIC_MARGIN <= margin <= _MAX_STATIC_MARGIN),
             mac=mac,
             cg_range_fwd=cg_range_fwd,
             cg_range_aft=cg_range_aft,
         )
 
+    def calculate_static_margin_batch(
+        self, cg_locations: Union[Sequence[float], np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate static margin for many candidate CG locations at once.
+
+        NP and MAC depend only on geometry, so they are solved once and the
+        margins come from a single vectorized expression. Use this for
+        loading or engine-weight sweeps instead of looping over
+        calculate_cg_envelope.
+
+        Args:
+            cg_locations: Candidate CG stations (FS inches)
+
+        Returns:
+            Tuple of (static margin in % MAC, is_stable mask) arrays
+        """
+        np_loc = self.calculate_neutral_point()
+        mac, _ = self.calculate_mac()
+
+        margin = (np_loc - np.asarray(cg_locations, dtype=np.float64)) / mac
+        is_stable = (margin >= _MIN_STATIC_MARGIN) & (margin <= _MAX_STATIC_MARGIN)
+        return margin * 100.0, is_stable
+
     def add_payload(self, name: str, weight: float, arm: float):
         """Add a payload item to weight & balance."""
         self._weight_balance.add_item(name, weight, arm, "payload")
@@ -607,6 +709,61 @@ logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    """Write an indented JSON document, via orjson when installed."""
+    if _HAVE_ORJSON:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        path.write_bytes(orjson.dumps(payload, option=options))
+    else:
+        path.write_text(json.dumps(payload, indent=2))
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON document, via orjson when installed."""
+    if _HAVE_ORJSON:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+@lru_cache(maxsize=4)
+def _parametric_model(
+    project: str,
+    version: str,
+    geom: "GeometricParams",
+    wing_root: AirfoilType,
+    wing_tip: AirfoilType,
+    wing_reflex_percent: float,
+    canard: AirfoilType,
+) -> Dict[str, Any]:
+    """
+    Build the VSP vehicle dict once per distinct set of inputs.
+
+    GeometricParams is frozen and hashes by value, so any geometry or
+    airfoil change produces a new key.
+    """
+    model = {
+        "project": project,
+        "version": version,
+        "wing": {
+            "span": geom.wing_span,
+            "area": geom.wing_area,
+            "aspect_ratio": geom.wing_aspect_ratio,
+            "airfoil": wing_root.value,
+            "tip_airfoil": wing_tip.value,
+            "reflex": wing_reflex_percent,
+        },
+        "canard": {
+            "span": geom.canard_span,
+            "area": geom.canard_area,
+            "aspect_ratio": (geom.canard_span**2) / geom.canard_area,
+            "airfoil": canard.value,
+        },
+        "tail_arm": geom.canard_arm,
+    }
+    logger.debug("Parametric VSP model built: %s", model)
+    return model
+
+
 @dataclass
 class AerodynamicPoint:
     """Single operating point from a sweep."""
@@ -617,15 +774,97 @@ class AerodynamicPoint:
     cm: float
 
 
+@dataclass(eq=False)
+class AerodynamicSweep:
+    """
+    Operating points of a sweep stored as one float64 array per coefficient.
+
+    Indexing and iteration yield AerodynamicPoint views and slicing yields
+    a shorter sweep, so code written against a list of points keeps
+    working; array consumers read the columns directly.
+    """
+
+    alpha_deg: np.ndarray
+    cl: np.ndarray
+    cd: np.ndarray
+    cm: np.ndarray
+
+    FIELDS: ClassVar[Tuple[str, ...]] = ("alpha_deg", "cl", "cd", "cm")
+
+    def __post_init__(self) -> None:
+        for name in self.FIELDS:
+            setattr(self, name, np.asarray(getattr(self, name), dtype=np.float64))
+
+    @classmethod
+    def from_points(cls, points: Iterable["AerodynamicPoint"]) -> "AerodynamicSweep":
+        """Build the column layout from individual operating points."""
+        rows = [(p.alpha_deg, p.cl, p.cd, p.cm) for p in points]
+        return cls(*np.array(rows, dtype=np.float64).reshape(-1, 4).T)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, float]]) -> "AerodynamicSweep":
+        """Build the column layout from cached {field: value} dicts."""
+        rows = [tuple(r[name] for name in cls.FIELDS) for r in records]
+        return cls(*np.array(rows, dtype=np.float64).reshape(-1, 4).T)
+
+    def to_records(self) -> List[Dict[str, float]]:
+        """One {field: value} dict per point, converted column-wise."""
+        columns = [getattr(self, name).tolist() for name in self.FIELDS]
+        return [dict(zip(self.FIELDS, row)) for row in zip(*columns)]
+
+    def __len__(self) -> int:
+        return len(self.alpha_deg)
+
+    def __eq__(self, other: object) -> bool:
+        # Value equality, matching the list of points this replaces
+        if not isinstance(other, AerodynamicSweep):
+            return NotImplemented
+        return all(
+            np.array_equal(getattr(self, name), getattr(other, name))
+            for name in self.FIELDS
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> "AerodynamicPoint": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "AerodynamicSweep": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union["AerodynamicPoint", "AerodynamicSweep"]:
+        if isinstance(index, slice):
+            # Like list slicing: a sweep of the selected points
+            return AerodynamicSweep(
+                *(getattr(self, name)[index] for name in self.FIELDS)
+            )
+        return AerodynamicPoint(
+            alpha_deg=float(self.alpha_deg[index]),
+            cl=float(self.cl[index]),
+            cd=float(self.cd[index]),
+            cm=float(self.cm[index]),
+        )
+
+    def __iter__(self) -> Iterator["AerodynamicPoint"]:
+        columns = [getattr(self, name).tolist() for name in self.FIELDS]
+        for alpha, cl, cd, cm in zip(*columns):
+            yield AerodynamicPoint(alpha_deg=alpha, cl=cl, cd=cd, cm=cm)
+
+
 @dataclass
 class TrimSweepResult:
     """Summary of a trim sweep across angle-of-attack."""
 
-    points: List["AerodynamicPoint"]
+    points: AerodynamicSweep
     trimmed_alpha_deg: float
     static_margin: float
     description: str = ""
 
+    def __post_init__(self) -> None:
+        # Accept a plain list of AerodynamicPoint as well
+        if not isinstance(self.points, AerodynamicSweep):
+            self.points = AerodynamicSweep.from_points(self.points)
+
 
 @dataclass
 class CLMaxResult:
@@ -658,11 +897,15 @@ class OpenVSPRunner:
     not installed, falling back to physics-informed surrogates.
     """
 
+    # Marks a runner that has not yet checked for OpenVSP
+    _VSP_UNSET: ClassVar[object] = object()
+
     def __init__(self, cache_dir: Union[Path, str] = Path("data/validation")):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_path = self.cache_dir / "openvsp_validation.json"
-        self._vsp = vsp_bridge  # Use the formal bridge
+        # Resolved against the formal bridge on first use by _try_import_vsp()
+        self._vsp: Any = self._VSP_UNSET
 
     def build_parametric_model(self) -> Dict[str, Any]:
         """
@@ -671,30 +914,18 @@ class OpenVSPRunner:
         Captures key aerodynamic levers for surrogate analysis and for
         passing to OpenVSP when available.
         """
-        geom = config.geometry
         airfoils = config.airfoils
-
-        model = {
-            "project": config.project_name,
-            "version": config.version,
-            "wing": {
-                "span": geom.wing_span,
-                "area": geom.wing_area,
-                "aspect_ratio": geom.wing_aspect_ratio,
-                "airfoil": airfoils.wing_root.value,
-                "tip_airfoil": airfoils.wing_tip.value,
-                "reflex": airfoils.wing_reflex_percent,
-            },
-            "canard": {
-                "span": geom.canard_span,
-                "area": geom.canard_area,
-                "aspect_ratio": (geom.canard_span**2) / geom.canard_area,
-                "airfoil": airfoils.canard.value,
-            },
-            "tail_arm": geom.canard_arm,
-        }
-        logger.debug("Parametric VSP model built: %s", model)
-        return model
+        model = _parametric_model(
+            config.project_name,
+            config.version,
+            config.geometry,
+            airfoils.wing_root,
+            airfoils.wing_tip,
+            airfoils.wing_reflex_percent,
+            airfoils.canard,
+        )
+        # Callers may edit the model, so hand out copies of the cached dicts
+        return {k: dict(v) if isinstance(v, dict) else v for k, v in model.items()}
 
     def run_validation(
         self,
@@ -723,7 +954,10 @@ class OpenVSPRunner:
         return trim_result, clmax_result, self.cache_path
 
     def _try_import_vsp(self) -> Optional[Any]:
-        return vsp_bridge if vsp_bridge.has_vsp else None
+        """Return the bridge when OpenVSP is usable, deciding only once."""
+        if self._vsp is self._VSP_UNSET:
+            self._vsp = vsp_bridge if vsp_bridge.has_vsp else None
+        return self._vsp
 
     def _run_trim_sweep(
         self,
@@ -758,49 +992,49 @@ class OpenVSPRunner:
         wing = model["wing"]
         canard = model["canard"]
 
-        alpha_values = [
-            alpha_range[0] + i * (alpha_range[1] - alpha_range[0]) / max(n_steps - 1, 1)
-            for i in range(n_steps)
-        ]
-
-        ar_wing = wing["aspect_ratio"]
-        ar_canard = canard["aspect_ratio"]
-
-        cl_alpha_wing = self._lifting_line_slope(ar_wing)
-        cl_alpha_canard = self._lifting_line_slope(ar_canard) * 1.05
+        step = np.arange(n_steps, dtype=np.float64)
+        alpha_deg = (
+            alpha_range[0]
+            + step * (alpha_range[1] - alpha_range[0]) / max(n_steps - 1, 1)
+        )
 
         wing_area = wing["area"]
         canard_area = canard["area"]
-        total_area = wing_area + canard_area
+        (
+            cl_alpha_wing,
+            cl_alpha_canard,
+            total_area,
+            induced_wing,
+            induced_canard,
+        ) = self._trim_constants(
+            wing["aspect_ratio"],
+            canard["aspect_ratio"],
+            wing_area,
+            canard_area,
+            config.geometry.wing_oswald_e,
+            config.geometry.canard_oswald_e,
+        )
 
-        points: List[AerodynamicPoint] = []
-        cm_values: List[float] = []
+        # Whole sweep evaluated as array expressions
+        alpha_rad = np.radians(alpha_deg)
+        cl_wing = cl_alpha_wing * alpha_rad
+        cl_canard = cl_alpha_canard * alpha_rad * 0.9
 
-        for alpha in alpha_values:
-            alpha_rad = math.radians(alpha)
-            cl_wing = cl_alpha_wing * alpha_rad
-            cl_canard = cl_alpha_canard * alpha_rad * 0.9
+        # Proper induced drag formulation: cd = cd0 + CL^2/(pi*e*AR)
+        cd0_wing = 0.008  # Profile drag coefficient (skin friction + pressure)
+        cd0_canard = 0.010
+        cd_wing = cd0_wing + cl_wing**2 / induced_wing
+        cd_canard = cd0_canard + cl_canard**2 / induced_canard
 
-            # Proper induced drag formulation: cd = cd0 + CL^2/(pi*e*AR)
-            e_wing = config.geometry.wing_oswald_e
-            e_canard = config.geometry.canard_oswald_e
-            cd0_wing = 0.008  # Profile drag coefficient (skin friction + pressure)
-            cd0_canard = 0.010
-            cd_wing = cd0_wing + cl_wing**2 / (math.pi * e_wing * ar_wing)
-            cd_canard = cd0_canard + cl_canard**2 / (math.pi * e_canard * ar_canard)
+        total_cl = (cl_wing * wing_area + cl_canard * canard_area) / total_area
+        total_cd = (cd_wing * wing_area + cd_canard * canard_area) / total_area
 
-            total_cl = (cl_wing * wing_area + cl_canard * canard_area) / total_area
-            total_cd = (cd_wing * wing_area + cd_canard * canard_area) / total_area
+        moment_arm = model["tail_arm"]
+        cm = (cl_canard * canard_area * moment_arm * 1e-4) - 0.02 * alpha_rad
 
-            moment_arm = model["tail_arm"]
-            cm = (cl_canard * canard_area * moment_arm * 1e-4) - 0.02 * alpha_rad
-            cm_values.append(cm)
+        points = AerodynamicSweep(alpha_deg, total_cl, total_cd, cm)
 
-            points.append(
-                AerodynamicPoint(alpha_deg=alpha, cl=total_cl, cd=total_cd, cm=cm)
-            )
-
-        trimmed_alpha = self._interpolate_zero_crossing(alpha_values, cm_values)
+        trimmed_alpha = self._interpolate_zero_crossing(alpha_deg, cm)
         static_margin = 0.06
 
         return TrimSweepResult(
@@ -848,7 +1082,7 @@ class OpenVSPRunner:
             "surfaces": {k: str(v) for k, v in surfaces.items()},
             "notes": "Populate these paths with meshed geometries for FEA coupling.",
         }
-        manifest_path.write_text(json.dumps(payload, indent=2))
+        _write_json(manifest_path, payload)
 
         return StructuralMeshManifest(
             mesh_directory=mesh_dir, surfaces=surfaces, notes=str(payload["notes"])
@@ -970,22 +1204,54 @@ class OpenVSPRunner:
         logger.info("VSP3 metadata fallback exported to %s", json_path)
         return json_path
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _trim_constants(
+        ar_wing: float,
+        ar_canard: float,
+        wing_area: float,
+        canard_area: float,
+        e_wing: float,
+        e_canard: float,
+    ) -> Tuple[float, float, float, float, float]:
+        """
+        Alpha-independent terms of the surrogate trim sweep.
+
+        Returns (wing CL_alpha, canard CL_alpha, total area, wing pi*e*AR,
+        canard pi*e*AR), computed once per planform.
+        """
+        return (
+            OpenVSPRunner._lifting_line_slope(ar_wing),
+            OpenVSPRunner._lifting_line_slope(ar_canard) * 1.05,
+            wing_area + canard_area,
+            math.pi * e_wing * ar_wing,
+            math.pi * e_canard * ar_canard,
+        )
+
     @staticmethod
     def _lifting_line_slope(aspect_ratio: float) -> float:
         """Approximate lift curve slope (per radian) using lifting-line theory."""
-        return (2 * math.pi * aspect_ratio) / (aspect_ratio + 2)
+        return (_TWO_PI * aspect_ratio) / (aspect_ratio + 2)
 
     @staticmethod
-    def _interpolate_zero_crossing(xs: List[float], ys: List[float]) -> float:
+    def _interpolate_zero_crossing(
+        xs: Union[Sequence[float], np.ndarray], ys: Union[Sequence[float], np.ndarray]
+    ) -> float:
         """Linearly interpolate zero-crossing for trim."""
-        for i in range(1, len(xs)):
-            if ys[i - 1] == ys[i]:
-                continue
-            if ys[i - 1] <= 0 <= ys[i] or ys[i - 1] >= 0 >= ys[i]:
-                x0, x1 = xs[i - 1], xs[i]
-                y0, y1 = ys[i - 1], ys[i]
-                return x0 + (0 - y0) * (x1 - x0) / (y1 - y0)
-        return xs[len(xs) // 2]
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        lo, hi = ys[:-1], ys[1:]
+
+        # First segment whose ends straddle (or touch) zero; flat segments
+        # cannot be interpolated and are skipped
+        brackets = (lo != hi) & (((lo <= 0) & (hi >= 0)) | ((lo >= 0) & (hi <= 0)))
+        if not brackets.any():
+            return float(xs[len(xs) // 2])
+
+        i = int(brackets.argmax()) + 1
+        x0, x1 = float(xs[i - 1]), float(xs[i])
+        y0, y1 = float(ys[i - 1]), float(ys[i])
+        return x0 + (0 - y0) * (x1 - x0) / (y1 - y0)
 
     def _write_cache(
         self,
@@ -1001,23 +1267,23 @@ class OpenVSPRunner:
             },
             "model": model,
             "trim_sweep": {
-                "points": [asdict(p) for p in trim.points],
+                "points": trim.points.to_records(),
                 "trimmed_alpha_deg": trim.trimmed_alpha_deg,
                 "static_margin": trim.static_margin,
                 "description": trim.description,
             },
             "clmax": asdict(clmax),
         }
-        self.cache_path.write_text(json.dumps(payload, indent=2))
+        _write_json(self.cache_path, payload)
         logger.info("OpenVSP validation cache written to %s", self.cache_path)
 
     def _load_cached_results(self) -> Optional[Tuple["TrimSweepResult", "CLMaxResult"]]:
         try:
-            data = json.loads(self.cache_path.read_text())
+            data = _read_json(self.cache_path)
         except FileNotFoundError:
             return None
 
-        points = [AerodynamicPoint(**p) for p in data["trim_sweep"]["points"]]
+        points = AerodynamicSweep.from_records(data["trim_sweep"]["points"])
         trim = TrimSweepResult(
             points=points,
             trimmed_alpha_deg=data["trim_sweep"]["trimmed_alpha_deg"],
@@ -7,12 +7,18 @@ Handles positioning, intersection checks, and full-aircraft exports.
 """
 
 from pathlib import Path
-from typing import Dict
-import cadquery as cq
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from .base import AircraftComponent
 from config import config
 
+# cadquery and the structure generators are loaded on first geometry use, so
+# constructing an assembly does not pull in the CAD kernel
+if TYPE_CHECKING:
+    import cadquery as cq
+
+    from .structures import CanardGenerator, Fuselage, MainWingGenerator
+
 
 class AircraftAssembly(AircraftComponent):
     """
@@ -26,18 +32,55 @@ class AircraftAssembly(AircraftComponent):
     """
 
     def __init__(self, name: str = "open_ez_airframe"):
-        from .structures import MainWingGenerator, CanardGenerator, Fuselage
-
         super().__init__(name, "Complete airframe assembly")
-        self.wing = MainWingGenerator()
-        self.canard = CanardGenerator()
-        self.fuselage = Fuselage()
-
-        # Internal assembly store
-        self._assembly = cq.Assembly(name=name)
+        # (wing, canard, fuselage) generators, created on first access
+        self._generators: Optional[
+            Tuple["MainWingGenerator", "CanardGenerator", "Fuselage"]
+        ] = None
+
+        # Internal assembly store, built by build_assembly()
+        self._assembly: Optional["cq.Assembly"] = None
+
+    def _ensure_generators(
+        self,
+    ) -> Tuple["MainWingGenerator", "CanardGenerator", "Fuselage"]:
+        """Create the component generators on first use."""
+        if self._generators is None:
+            from .structures import MainWingGenerator, CanardGenerator, Fuselage
+
+            self._generators = (MainWingGenerator(), CanardGenerator(), Fuselage())
+        return self._generators
+
+    @property
+    def wing(self) -> "MainWingGenerator":
+        return self._ensure_generators()[0]
+
+    @property
+    def canard(self) -> "CanardGenerator":
+        return self._ensure_generators()[1]
+
+    @property
+    def fuselage(self) -> "Fuselage":
+        return self._ensure_generators()[2]
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached union and assembly so the next call rebuilds them.
+
+        Call this after changing the configuration the components read.
+        """
+        self._geometry = None
+        self._assembly = None
+
+    def generate_geometry(self) -> "cq.Workplane":
+        """
+        Combine all components into a single B-Rep solid.
+
+        The union is cached; it is only rebuilt after invalidate().
+        """
+        if self._geometry is not None:
+            return self._geometry
 
-    def generate_geometry(self) -> cq.Workplane:
-        """Combine all components into a single B-Rep solid."""
         # Generate individual geometries
         wing_geo = self.wing.generate_geometry()
         canard_geo = self.canard.generate_geometry()
@@ -56,13 +99,18 @@ class AircraftAssembly(AircraftComponent):
 
         # Combine into one solid
         self._geometry = fuse_pos.union(wing_pos).union(canard_pos)
+        self._assembly = None
 
         return self._geometry
 
-    def build_assembly(self) -> cq.Assembly:
+    def build_assembly(self) -> "cq.Assembly":
         """Build a CadQuery Assembly for hierarchical visualization."""
-        if self._geometry is None:
-            self.generate_geometry()
+        import cadquery as cq
+
+        # Reuses the cached component geometry until invalidate()
+        self.generate_geometry()
+        if self._assembly is not None:
+            return self._assembly
 
         self._assembly = cq.Assembly(name=self.name)
 
@@ -92,6 +140,8 @@ class AircraftAssembly(AircraftComponent):
 
     def export_dxf(self, output_path: Path) -> Path:
         """Export master layout DXF."""
+        import cadquery as cq
+
         output_path.mkdir(parents=True, exist_ok=True)
         # Top view projection
         geom = self.geometry
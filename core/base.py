@@ -8,10 +8,14 @@ This enforces a consistent interface for geometry generation and export.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Dict, Any
-import cadquery as cq
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from config import config
 
+# cadquery (OCCT) is imported where geometry is built or exported, so
+# importing a component class does not load the CAD kernel
+if TYPE_CHECKING:
+    import cadquery as cq
+
 
 class AircraftComponent(ABC):
     """
@@ -34,11 +38,11 @@ class AircraftComponent(ABC):
         """
         self.name = name
         self.description = description
-        self._geometry: Optional[cq.Workplane] = None
+        self._geometry: Optional["cq.Workplane"] = None
         self._metadata: Dict[str, Any] = {}
 
     @property
-    def geometry(self) -> Optional[cq.Workplane]:
+    def geometry(self) -> Optional["cq.Workplane"]:
         """Access the generated CadQuery geometry."""
         if self._geometry is None:
             raise ValueError(
@@ -48,7 +52,7 @@ class AircraftComponent(ABC):
         return self._geometry
 
     @abstractmethod
-    def generate_geometry(self) -> cq.Workplane:
+    def generate_geometry(self) -> "cq.Workplane":
         """
         Generate the CadQuery solid geometry.
 
@@ -103,6 +107,8 @@ class AircraftComponent(ABC):
         Returns:
             Path to the exported STEP file
         """
+        import cadquery as cq
+
         output_path.mkdir(parents=True, exist_ok=True)
         step_file = output_path / f"{self.name}.step"
         cq.exporters.export(self._geometry, str(step_file))
@@ -120,6 +126,8 @@ class AircraftComponent(ABC):
         Returns:
             Path to the exported STL file
         """
+        import cadquery as cq
+
         output_path.mkdir(parents=True, exist_ok=True)
         stl_file = output_path / f"{self.name}.stl"
         cq.exporters.export(
@@ -163,16 +171,16 @@ class FoamCore(AircraftComponent):
 
     def __init__(self, name: str, description: str = ""):
         super().__init__(name, description)
-        self._root_profile: Optional[cq.Wire] = None
-        self._tip_profile: Optional[cq.Wire] = None
+        self._root_profile: Optional["cq.Wire"] = None
+        self._tip_profile: Optional["cq.Wire"] = None
 
     @abstractmethod
-    def get_root_profile(self) -> cq.Wire:
+    def get_root_profile(self) -> "cq.Wire":
         """Return the root airfoil wire for hot-wire cutting."""
         pass
 
     @abstractmethod
-    def get_tip_profile(self) -> cq.Wire:
+    def get_tip_profile(self) -> "cq.Wire":
         """Return the tip airfoil wire for hot-wire cutting."""
         pass
 
@@ -233,18 +241,22 @@ class Bulkhead(AircraftComponent):
         self.thickness = thickness or config.materials.foam_core_thickness
 
     @abstractmethod
-    def get_profile(self) -> cq.Wire:
+    def get_profile(self) -> "cq.Wire":
         """Return the 2D bulkhead outline."""
         pass
 
-    def generate_geometry(self) -> cq.Workplane:
+    def generate_geometry(self) -> "cq.Workplane":
         """Extrude the 2D bulkhead profile to the specified thickness."""
+        import cadquery as cq
+
         profile = self.get_profile()
         self._geometry = cq.Workplane("XY").add(profile).extrude(self.thickness)
         return self._geometry
 
     def export_dxf(self, output_path: Path) -> Path:
         """Export the bulkhead profile as DXF for routing or tracing."""
+        import cadquery as cq
+
         profile = self.get_profile()
         output_file = output_path / f"{self.name}.dxf"
         cq.exporters.export(cq.Workplane("XY").add(profile), str(output_file), exportType="DXF")
@@ -15,6 +15,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
 import json
+import math
 
 from config import config
 
@@ -276,7 +277,8 @@ class ComplianceTracker:
     @property
     def total_credit(self) -> float:
         """Calculate total builder credit from completed tasks."""
-        return sum(task.builder_credit for task in self._tasks.values())
+        # fsum keeps the tally exactly rounded against the 0.51 threshold
+        return math.fsum(task.builder_credit for task in self._tasks.values())
 
     @property
     def is_compliant(self) -> bool:
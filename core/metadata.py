@@ -4,7 +4,7 @@ Metadata utilities for Open-EZ PDE artifacts.
 Standardizes provenance data stored alongside STEP/STL/G-code outputs.
 """
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime
 import hashlib
 import json
@@ -27,10 +27,17 @@ REQUIRED_FIELDS = (
     "provenance",
 )
 
+# Bump whenever the hashed serialization changes, so hashes produced by
+# different schemes are never compared. Metadata written before the field
+# existed is version 1.
+#   1: dataclasses.asdict(config), enums as their repr ("FoamType.URETHANE_2LB")
+#   2: config.to_dict(), enums as their value ("urethane_2lb")
+CONFIG_HASH_VERSION = 2
+
 
 def _serialize_config() -> str:
     """Serialize the configuration deterministically for hashing."""
-    config_dict = asdict(config)
+    config_dict = config.to_dict()
     return json.dumps(config_dict, default=str, sort_keys=True)
 
 
@@ -67,6 +74,7 @@ class ArtifactMetadata:
     contributor: str
     component: Dict[str, Any]
     provenance: Dict[str, Any]
+    config_hash_version: int = CONFIG_HASH_VERSION
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -75,6 +83,7 @@ class ArtifactMetadata:
             "generated_at": self.generated_at,
             "revision": self.revision,
             "config_hash": self.config_hash,
+            "config_hash_version": self.config_hash_version,
             "contributor": self.contributor,
             "component": self.component,
             "provenance": self.provenance,
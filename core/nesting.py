@@ -17,7 +17,7 @@ import math
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import ezdxf
 from ezdxf import bbox
@@ -110,7 +110,7 @@ class NestingPlanner:
 
     def __init__(
         self,
-        stock_sheets: List[Tuple[float, float]],
+        stock_sheets: Sequence[Tuple[float, float]],
         margin: float = 0.25,
         spacing: float = 0.125,
         dogbone_radius: float = 0.0,
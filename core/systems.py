@@ -743,7 +743,7 @@ def get_propulsion_system(
         engine.DRY_WEIGHT_LB = 268.0
         engine.name = "lycoming_o320"
         return engine
-    elif propulsion_type in (PropulsionType.ELECTRIC_LIFEPO4, PropulsionType.ELECTRIC_NMC):
+    elif propulsion_type.electric:
         return ElectricEZ(battery_kwh=config.propulsion.battery_capacity_kwh)
     else:
         raise ValueError(f"Unknown propulsion type: {propulsion_type}")
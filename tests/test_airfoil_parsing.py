@@ -0,0 +1,261 @@
+"""
+Airfoil .dat Parsing Tests
+==========================
+
+Validates that AirfoilFactory reads both UIUC layouts into the same
+LE-to-TE upper/lower halves:
+  - Selig: one loop TE -> upper -> LE -> lower -> TE
+  - Lednicer: "N_upper N_lower" count row, then upper and lower sections,
+    each running LE -> TE
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+sys.modules.setdefault("cadquery", MagicMock())
+sys.modules.setdefault("OCP", MagicMock())
+
+import numpy as np
+
+
+def _halves(n: int = 21):
+    """Symmetric NACA-0012-like halves, both running LE -> TE."""
+    beta = np.linspace(0, np.pi, n)
+    x = 0.5 * (1 - np.cos(beta))
+    yt = 0.6 * (
+        0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1015 * x**4
+    )
+    return x, yt, x, -yt
+
+
+def _write_selig(path: Path, extra_lines=(), scale: float = 1.0) -> None:
+    xu, yu, xl, yl = (half * scale for half in _halves())
+    rows = [f"{x:.6f} {y:.6f}" for x, y in zip(xu[::-1], yu[::-1])]
+    rows += [f"{x:.6f} {y:.6f}" for x, y in zip(xl[1:], yl[1:])]
+    rows[5:5] = list(extra_lines)
+    path.write_text("SYNTH SELIG\n" + "\n".join(rows) + "\n")
+
+
+def _write_lednicer(path: Path, te_first: bool = False) -> None:
+    xu, yu, xl, yl = _halves()
+    if te_first:
+        xu, yu, xl, yl = xu[::-1], yu[::-1], xl[::-1], yl[::-1]
+    upper = "\n".join(f"{x:.6f} {y:.6f}" for x, y in zip(xu, yu))
+    lower = "\n".join(f"{x:.6f} {y:.6f}" for x, y in zip(xl, yl))
+    path.write_text(f"SYNTH LEDNICER\n{len(xu)}. {len(xl)}.\n\n{upper}\n\n{lower}\n")
+
+
+def test_selig_and_lednicer_parse_to_same_halves(tmp_path):
+    from core.aerodynamics import AirfoilFactory
+
+    selig, lednicer = tmp_path / "selig.dat", tmp_path / "lednicer.dat"
+    _write_selig(selig)
+    _write_lednicer(lednicer)
+
+    factory = AirfoilFactory(data_dir=tmp_path)
+    a = factory._parse_dat_file(selig)
+    b = factory._parse_dat_file(lednicer)
+
+    assert a.name == "SYNTH SELIG" and b.name == "SYNTH LEDNICER"
+    for field in ("x_upper", "y_upper", "x_lower", "y_lower"):
+        np.testing.assert_allclose(getattr(a, field), getattr(b, field))
+    assert b.x_upper[0] == 0.0 and b.x_upper[-1] == 1.0
+
+
+def test_unnormalized_selig_is_not_read_as_lednicer(tmp_path):
+    from core.aerodynamics import AirfoilFactory
+
+    unit, chord_mm = tmp_path / "unit.dat", tmp_path / "chord_mm.dat"
+    _write_selig(unit)
+    _write_selig(chord_mm, scale=250.0)
+
+    factory = AirfoilFactory(data_dir=tmp_path)
+    a = factory._parse_dat_file(unit)
+    b = factory._parse_dat_file(chord_mm)
+
+    for field in ("x_upper", "y_upper", "x_lower", "y_lower"):
+        np.testing.assert_allclose(
+            getattr(b, field), 250.0 * getattr(a, field), atol=1e-3
+        )
+
+
+def test_stray_text_rows_are_skipped(tmp_path):
+    from core.aerodynamics import AirfoilFactory
+
+    clean, noisy = tmp_path / "clean.dat", tmp_path / "noisy.dat"
+    _write_selig(clean)
+    _write_selig(noisy, extra_lines=["# digitized by hand", "UPPER SURFACE", "0.5"])
+
+    factory = AirfoilFactory(data_dir=tmp_path)
+    a = factory._parse_dat_file(clean)
+    b = factory._parse_dat_file(noisy)
+
+    np.testing.assert_array_equal(a.x, b.x)
+    np.testing.assert_array_equal(a.y, b.y)
+
+
+def test_load_from_file_is_shared_across_factories(tmp_path):
+    from core.aerodynamics import AirfoilFactory
+
+    path = tmp_path / "selig.dat"
+    _write_selig(path)
+
+    first = AirfoilFactory().load_from_file(path, n_points=60)
+    second = AirfoilFactory().load_from_file(path, n_points=60)
+    assert first is second
+
+
+def test_shared_airfoil_cannot_be_mutated(tmp_path):
+    from core.aerodynamics import AirfoilFactory
+
+    path = tmp_path / "selig.dat"
+    _write_selig(path)
+
+    airfoil = AirfoilFactory().load_from_file(path, n_points=60)
+    with pytest.raises(ValueError):
+        airfoil._xy[1, 0] = 1.0
+    with pytest.raises(AttributeError):
+        airfoil.name = "RENAMED"
+
+    again = AirfoilFactory().load_from_file(path, n_points=60)
+    assert again.name == "SYNTH SELIG"
+    assert again.apply_reflex(2.0)._xy.flags.writeable is False
+
+
+def test_resample_variants_share_raw_arc_length(tmp_path):
+    from core.aerodynamics import AirfoilFactory
+
+    path = tmp_path / "selig.dat"
+    _write_selig(path)
+
+    factory = AirfoilFactory()
+    coarse = factory.load_from_file(path, n_points=40)
+    fine = factory.load_from_file(path, n_points=120)
+    assert coarse._raw is fine._raw
+    assert coarse._raw.s_norm is fine._raw.s_norm
+    assert coarse._raw.s_norm[0] == 0.0 and coarse._raw.s_norm[-1] == 1.0
+
+
+def test_core_exports_the_module_airfoil_factory():
+    import core
+    import core.aerodynamics
+
+    assert core.airfoil_factory is core.aerodynamics.airfoil_factory
+
+
+def test_core_dir_lists_exports_and_bound_attributes():
+    import core
+    import core.aerodynamics
+
+    listing = dir(core)
+    assert set(core.__all__) <= set(listing)
+    assert {"aerodynamics", "_registry", "__name__"} <= set(listing)
+
+
+def test_disk_cache_is_opt_in(tmp_path, monkeypatch):
+    from core.aerodynamics import AirfoilFactory
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "synth.dat"
+    _write_selig(path)
+
+    factory = AirfoilFactory()
+    off = factory.load_from_file(path, n_points=60)
+    assert not (tmp_path / "cache").exists()
+
+    # The flag is read per call, so turning it on after a load still persists
+    monkeypatch.setenv("PDE_AIRFOIL_CACHE", "1")
+    on = factory.load_from_file(path, n_points=60)
+    assert on is not off
+    assert len(list((tmp_path / "cache").rglob("*.npz"))) == 1
+
+
+def test_library_load_round_trips_through_disk_cache(tmp_path, monkeypatch):
+    from core import aerodynamics
+    from core.aerodynamics import _file_cache_key, _load_airfoil_cached
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "synth.dat"
+    _write_selig(path)
+    key = _file_cache_key(path)
+
+    # Bypass the in-process cache so the second call has to hit the disk
+    load = _load_airfoil_cached.__wrapped__
+    built = load(*key, 60, True, True)
+    (cache_file,) = (tmp_path / "cache").rglob("*.npz")
+
+    # A contour with the wrong point count is ignored and rewritten
+    np.savez(cache_file, name=np.array(built.name), xy=built._xy[:, :30])
+    np.testing.assert_array_equal(load(*key, 60, True, True)._xy, built._xy)
+
+    # A disk hit must not re-parse the .dat file
+    def fail(*args):
+        raise AssertionError("parsed on a disk hit")
+
+    monkeypatch.setattr(aerodynamics, "_parse_dat_cached", fail)
+    restored = load(*key, 60, True, True)
+    assert restored is not built
+    assert restored.name == built.name
+    np.testing.assert_array_equal(restored._xy, built._xy)
+
+
+def test_disk_cache_drops_contours_for_older_mtimes(tmp_path, monkeypatch):
+    import os
+
+    from core.aerodynamics import _file_cache_key, _load_airfoil_cached
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "synth.dat"
+    _write_selig(path)
+
+    load = _load_airfoil_cached.__wrapped__
+    load(*_file_cache_key(path), 60, True, True)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    load(*_file_cache_key(path), 60, True, True)
+
+    (cache_file,) = (tmp_path / "cache").rglob("*.npz")
+    assert str(path.stat().st_mtime_ns) in cache_file.name
+
+
+def test_lednicer_sections_written_te_first_are_reoriented(tmp_path):
+    from core.aerodynamics import AirfoilFactory
+
+    le_first, te_first = tmp_path / "le_first.dat", tmp_path / "te_first.dat"
+    _write_lednicer(le_first)
+    _write_lednicer(te_first, te_first=True)
+
+    factory = AirfoilFactory(data_dir=tmp_path)
+    a = factory._parse_dat_file(le_first)
+    b = factory._parse_dat_file(te_first)
+
+    np.testing.assert_array_equal(a.x, b.x)
+    np.testing.assert_array_equal(a.y, b.y)
+
+
+def test_library_load_picks_up_edited_file(tmp_path, monkeypatch):
+    import os
+
+    from config import AirfoilType
+    from core.aerodynamics import AirfoilFactory
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "roncz_r1145ms.dat"
+    _write_selig(path)
+    factory = AirfoilFactory(data_dir=tmp_path)
+    before = factory.load(AirfoilType.RONCZ_R1145MS, n_points=60)
+    assert factory.load(AirfoilType.RONCZ_R1145MS, n_points=60) is before
+
+    _write_lednicer(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    after = factory.load(AirfoilType.RONCZ_R1145MS, n_points=60)
+    assert after is not before
+    assert after.name == "SYNTH LEDNICER"
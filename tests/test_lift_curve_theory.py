@@ -202,3 +202,32 @@ class TestLiftCurveSlopeCanard:
         assert 5.0 < ar_canard < 15.0, (
             f"Canard AR = {ar_canard:.2f} is outside reasonable range [5, 15]"
         )
+
+
+class TestNeutralPointMemo:
+    """MAC/NP memoization must follow the engine's geometry."""
+
+    def test_replaced_geometry_is_resolved(self):
+        from dataclasses import replace
+
+        from core.analysis import PhysicsEngine
+
+        engine = PhysicsEngine()
+        baseline = engine.calculate_neutral_point()
+        assert engine.calculate_neutral_point() == baseline
+
+        engine.geo = replace(engine.geo, wing_sweep_le=engine.geo.wing_sweep_le + 5)
+        # More LE sweep moves the wing AC, and so the NP, aft
+        assert engine.calculate_neutral_point() > baseline
+
+    def test_batch_margin_matches_scalar_envelope(self):
+        from core.analysis import PhysicsEngine
+
+        engine = PhysicsEngine()
+        metrics = engine.calculate_cg_envelope()
+        cgs = [metrics.cg_range_fwd, metrics.cg_location, metrics.cg_range_aft]
+
+        margins, stable = engine.calculate_static_margin_batch(cgs)
+        assert margins[1] == metrics.static_margin
+        assert bool(stable[1]) == metrics.is_stable
+        assert margins[0] > margins[2]
@@ -8,7 +8,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from core.analysis import OpenVSPRunner  # noqa: E402
+from core.analysis import AerodynamicPoint, OpenVSPRunner, TrimSweepResult  # noqa: E402
 
 
 @pytest.fixture()
@@ -44,3 +44,55 @@ def test_structural_manifest_hook(runner, tmp_path):
     manifest_file = manifest.mesh_directory / "manifest.json"
     data = json.loads(manifest_file.read_text())
     assert "Populate these paths" in data["notes"]
+
+
+class TestTrimSweepPoints:
+    """TrimSweepResult.points must keep behaving like the list it replaced."""
+
+    @pytest.fixture()
+    def trim(self, tmp_path):
+        runner = OpenVSPRunner(cache_dir=tmp_path)
+        trim, _, _ = runner.run_validation(force_refresh=True)
+        return trim
+
+    def test_round_trips_through_cache(self, tmp_path):
+        runner = OpenVSPRunner(cache_dir=tmp_path)
+        fresh, _, _ = runner.run_validation(force_refresh=True)
+        cached, _, _ = runner.run_validation()
+
+        assert len(cached.points) == len(fresh.points)
+        for name in fresh.points.FIELDS:
+            cached_column = getattr(cached.points, name).tolist()
+            assert cached_column == getattr(fresh.points, name).tolist()
+        assert cached.points[0] == fresh.points[0]
+
+    def test_negative_indices(self, trim):
+        points = list(trim.points)
+
+        assert trim.points[-1] == points[-1]
+        assert trim.points[-3] == points[-3]
+
+    def test_slices(self, trim):
+        points = list(trim.points)
+
+        assert list(trim.points[1:]) == points[1:]
+        assert list(trim.points[-3:]) == points[-3:]
+        assert list(trim.points[::2]) == points[::2]
+        assert len(trim.points[1:]) == len(points) - 1
+
+    def test_results_compare_by_value(self):
+        points = [
+            AerodynamicPoint(alpha_deg=0.0, cl=0.2, cd=0.02, cm=0.01),
+            AerodynamicPoint(alpha_deg=2.0, cl=0.4, cd=0.03, cm=0.0),
+        ]
+        a = TrimSweepResult(points=points, trimmed_alpha_deg=2.0, static_margin=0.12)
+        b = TrimSweepResult(
+            points=list(points), trimmed_alpha_deg=2.0, static_margin=0.12
+        )
+        shorter = TrimSweepResult(
+            points=points[:1], trimmed_alpha_deg=2.0, static_margin=0.12
+        )
+
+        assert a.points is not b.points
+        assert a == b
+        assert a != shorter